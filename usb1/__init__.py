@@ -36,6 +36,12 @@ Features:
 - Asynchronous I/O (control, bulk, interrupt, isochronous)
   Note: Isochronous support is not well tested.
   See USBPoller, USBTransfer and USBTransferHelper.
+  For asyncio applications, see USBAsyncioPoller and USBDeviceHandle
+  *Async methods. For threaded applications, see USBEventThread and
+  USBDeviceHandle *Future methods.
+- Streaming, keeping several asynchronous transfers submitted
+  See USBBulkReader, USBBulkWriter, USBIsochronousReader and
+  USBIsochronousWriter.
 
 All LIBUSB_* constants are available in this module, without the LIBUSB_
 prefix - with one exception: LIBUSB_5GBPS_OPERATION is available as
@@ -51,13 +57,30 @@ from ctypes import byref, c_int, sizeof, POINTER, \
     c_char
 from ctypes.util import find_library
 import sys
+import select
 import threading
+import time
 import warnings
 import weakref
 import collections
+import itertools
 import functools
 import contextlib
 import inspect
+try:
+    import asyncio
+except ImportError:
+    # Python < 3.4
+    asyncio = None
+    _getRunningLoop = None
+else:
+    # Python < 3.5.3 cannot tell: always assume another thread.
+    _getRunningLoop = getattr(asyncio, '_get_running_loop', lambda: None)
+try:
+    from concurrent.futures import Future as _ConcurrentFuture
+except ImportError:
+    # Python 2 without "futures" backport
+    _ConcurrentFuture = None
 from . import libusb1
 if sys.version_info[:2] >= (2, 6):
 # pylint: disable=wrong-import-order,ungrouped-imports
@@ -77,6 +100,9 @@ __all__ = [
     'USBPoller', 'USBTransfer', 'USBTransferHelper', 'EVENT_CALLBACK_SET',
     'USBEndpoint', 'USBInterfaceSetting', 'USBInterface',
     'USBConfiguration', 'DoomedTransferError', 'getVersion', 'USBError',
+    'USBBufferArena', 'USBCompletionQueue', 'USBBulkReader',
+    'USBBulkWriter', 'USBIsochronousReader', 'USBIsochronousWriter',
+    'USBAsyncioPoller', 'USBEventThread',
 ]
 # Bind libusb1 constants and libusb1.USBError to this module, so user does not
 # have to import two modules.
@@ -124,6 +150,23 @@ def raiseUSBError(
     ):
     raise __STATUS_TO_EXCEPTION_DICT.get(value, __USBError)(value)
 
+def raiseUSBTransferError(
+        value,
+        transferred,
+        # Avoid globals lookup on call to work during interpreter shutdown.
+        # pylint: disable=dangerous-default-value
+        __STATUS_TO_EXCEPTION_DICT=STATUS_TO_EXCEPTION_DICT,
+        # pylint: enable=dangerous-default-value
+        __USBError=USBError,
+    ):
+    """
+    Like raiseUSBError, also storing the number of bytes transferred before
+    the error as the "transferred" property of the exception.
+    """
+    error = __STATUS_TO_EXCEPTION_DICT.get(value, __USBError)(value)
+    error.transferred = transferred
+    raise error
+
 def mayRaiseUSBError(
         value,
         # Avoid globals lookup on call to work during interpreter shutdown.
@@ -259,8 +302,212 @@ EVENT_CALLBACK_SET = frozenset((
     # pylint: enable=undefined-variable
 ))
 
+# Error code corresponding to each non-successful transfer status, as in
+# libusb's synchronous API.
+TRANSFER_STATUS_TO_ERROR_DICT = {
+    # pylint: disable=undefined-variable
+    TRANSFER_ERROR: ERROR_IO,
+    TRANSFER_TIMED_OUT: ERROR_TIMEOUT,
+    TRANSFER_CANCELLED: ERROR_IO,
+    TRANSFER_STALL: ERROR_PIPE,
+    TRANSFER_NO_DEVICE: ERROR_NO_DEVICE,
+    TRANSFER_OVERFLOW: ERROR_OVERFLOW,
+    # pylint: enable=undefined-variable
+}
+
+def getTransferStatusError(
+        status,
+        # Avoid globals lookup on call to work during interpreter shutdown.
+        # pylint: disable=dangerous-default-value
+        __TRANSFER_STATUS_TO_ERROR_DICT=TRANSFER_STATUS_TO_ERROR_DICT,
+        __STATUS_TO_EXCEPTION_DICT=STATUS_TO_EXCEPTION_DICT,
+        # pylint: enable=dangerous-default-value
+        __USBError=USBError,
+    ):
+    """
+    Return an USBError instance describing given non-successful transfer
+    status.
+    """
+    value = __TRANSFER_STATUS_TO_ERROR_DICT.get(status, status)
+    return __STATUS_TO_EXCEPTION_DICT.get(value, __USBError)(value)
+
 DEFAULT_ASYNC_TRANSFER_ERROR_CALLBACK = lambda x: False
 
+try:
+    _clock = time.perf_counter
+except AttributeError:
+    # Python < 3.3
+    _clock = time.time
+
+# In USBEventThread threads, "callback_time" is a one-item list accumulating
+# the time spent in transfer callbacks.
+_event_thread_local = threading.local()
+
+def _getByteView(data):
+    """
+    Return a memoryview of given buffer whose items are bytes, so lengths
+    and slices count bytes whatever the buffer's item type (ex: array('H')).
+    """
+    view = memoryview(data)
+    if sys.version_info[0] == 3:
+        view = view.cast('B')
+    return view
+
+def _handleEventsUntil(
+        context, predicate, completed, timeout=None,
+        # Avoid globals lookup on call to work during interpreter shutdown.
+        # pylint: disable=undefined-variable
+        __USBErrorInterrupted=USBErrorInterrupted,
+        # pylint: enable=undefined-variable
+    ):
+    """
+    Handle events of given USBContext until predicate returns a true value,
+    or timeout (in seconds, None to wait forever) expires.
+    predicate is called without argument before each event handling.
+    completed (ctypes.c_int): see USBContext.handleEventsCompleted. Cleared
+      before each predicate call, so a completion happening after the call
+      stops event handling.
+    Returns predicate's last value.
+    """
+    if timeout is not None:
+        deadline = _clock() + timeout
+    while True:
+        completed.value = 0
+        result = predicate()
+        if result:
+            break
+        try:
+            if timeout is None:
+                context.handleEventsCompleted(completed)
+            else:
+                remaining = deadline - _clock()
+                if remaining <= 0:
+                    break
+                context.handleEventsTimeoutCompleted(remaining, completed)
+        except __USBErrorInterrupted:
+            pass
+    return result
+
+def _getDefaultLoop():
+    """
+    Return the event loop running in current thread, for asyncio methods
+    called without an explicit loop.
+    Raises RuntimeError if there is none, as asyncio.get_event_loop is
+    deprecated outside of a running loop.
+    """
+    get_running_loop = getattr(asyncio, '_get_running_loop', None)
+    if get_running_loop is None:
+        # Python < 3.5.3, where get_event_loop is not deprecated.
+        return asyncio.get_event_loop()
+    loop = get_running_loop()
+    if loop is None:
+        raise RuntimeError(
+            'No running event loop: an explicit loop must be given',
+        )
+    return loop
+
+def _setCompleted(completed, _):
+    completed.value = 1
+
+def _getTransferData(transfer):
+    return transfer.getBuffer()[:transfer.getActualLength()]
+
+def _getControlTransferData(transfer):
+    # getBuffer returns a view on the transfer buffer (past the setup
+    # packet), which will be reused once transfer is closed.
+    return bytearray(transfer.getBuffer()[:transfer.getActualLength()])
+
+def _getTransferActualLength(transfer):
+    return transfer.getActualLength()
+
+# Helpers for USBDeviceHandle future-returning methods.
+# Each returns a (configure, get_result) tuple for
+# USBDeviceHandle._submitTransfer .
+def _controlWriteSetup(request_type, request, value, index, data, timeout):
+    # pylint: disable=undefined-variable
+    request_type = (request_type & ~ENDPOINT_DIR_MASK) | ENDPOINT_OUT
+    # pylint: enable=undefined-variable
+    return (
+        lambda transfer, callback: transfer.setControl(
+            request_type, request, value, index, data,
+            callback=callback, timeout=timeout,
+        ),
+        _getTransferActualLength,
+    )
+
+def _controlReadSetup(request_type, request, value, index, length, timeout):
+    # pylint: disable=undefined-variable
+    request_type = (request_type & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
+    # pylint: enable=undefined-variable
+    return (
+        lambda transfer, callback: transfer.setControl(
+            request_type, request, value, index, length,
+            callback=callback, timeout=timeout,
+        ),
+        _getControlTransferData,
+    )
+
+def _bulkWriteSetup(endpoint, data, timeout):
+    # pylint: disable=undefined-variable
+    endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_OUT
+    # pylint: enable=undefined-variable
+    return (
+        lambda transfer, callback: transfer.setBulk(
+            endpoint, data, callback=callback, timeout=timeout,
+        ),
+        _getTransferActualLength,
+    )
+
+def _bulkReadSetup(endpoint, length, timeout):
+    # pylint: disable=undefined-variable
+    endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
+    # pylint: enable=undefined-variable
+    return (
+        lambda transfer, callback: transfer.setBulk(
+            endpoint, length, callback=callback, timeout=timeout,
+        ),
+        _getTransferData,
+    )
+
+def _interruptWriteSetup(endpoint, data, timeout):
+    # pylint: disable=undefined-variable
+    endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_OUT
+    # pylint: enable=undefined-variable
+    return (
+        lambda transfer, callback: transfer.setInterrupt(
+            endpoint, data, callback=callback, timeout=timeout,
+        ),
+        _getTransferActualLength,
+    )
+
+def _interruptReadSetup(endpoint, length, timeout):
+    # pylint: disable=undefined-variable
+    endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
+    # pylint: enable=undefined-variable
+    return (
+        lambda transfer, callback: transfer.setInterrupt(
+            endpoint, length, callback=callback, timeout=timeout,
+        ),
+        _getTransferData,
+    )
+
+def _resolveFuture(future, error, result):
+    if future.done():
+        # Cancelled while transfer was completing.
+        return
+    if error is None:
+        future.set_result(result)
+    else:
+        future.set_exception(error)
+
+def _resolveConcurrentFuture(future, error, result):
+    if not future.set_running_or_notify_cancel():
+        return
+    if error is None:
+        future.set_result(result)
+    else:
+        future.set_exception(error)
+
 def create_binary_buffer(init_or_size):
     """
     ctypes.create_string_buffer variant which does not add a trailing null
@@ -272,6 +519,8 @@ def create_binary_buffer(init_or_size):
     # Testing the latter confuses 2to3, so test the former.
     if isinstance(init_or_size, (int, long)):
         init_or_size = bytearray(init_or_size)
+    elif isinstance(init_or_size, _ArenaSlot):
+        return init_or_size.c_buffer, init_or_size.buffer
     return create_initialised_buffer(init_or_size)
 
 def create_initialised_buffer(init):
@@ -286,6 +535,118 @@ def create_initialised_buffer(init):
         init = bytearray(init)
         return string_type.from_buffer(init), init
 
+def create_writable_buffer(data):
+    """
+    Return a ctypes array sharing memory with given writable buffer, for
+    libusb to write into.
+    Raises TypeError if data is not a writable contiguous buffer.
+    """
+    if isinstance(data, _ArenaSlot):
+        return data.c_buffer
+    try:
+        length = memoryview(data).nbytes
+    except (TypeError, AttributeError):
+        # python 2's memoryview has no nbytes
+        length = len(data)
+    try:
+        return (c_char * length).from_buffer(data)
+    # cpython raises TypeError, pypy raises ValueError
+    except (TypeError, ValueError):
+        raise TypeError('data must be a writable contiguous buffer')
+
+class _ArenaSlot(object):
+    """
+    A slab borrowed from an USBBufferArena.
+
+    buffer
+        Writable memoryview of the slab, to fill data to send and read
+        received data.
+    c_buffer
+        ctypes array over the same memory, for libusb.
+    """
+    __slots__ = ('buffer', 'c_buffer')
+
+    def __init__(self, c_buffer, buffer_):
+        self.c_buffer = c_buffer
+        self.buffer = buffer_
+
+    def __len__(self):
+        return len(self.buffer)
+
+class USBBufferArena(object):
+    """
+    Fixed-size transfer buffers ("slabs") carved from a single preallocated
+    bytearray.
+
+    Slabs are borrowed with borrow(), which returns an opaque slot object
+    accepted by USBTransfer's setBulk, setInterrupt, setIsochronous and
+    setBuffer in place of buffer_or_len. As the ctypes view of each slab is
+    created once and for all when the arena is created, using a slot
+    involves no python memory allocation nor ctypes type creation. Slot's
+    "buffer" property is a writable memoryview of its slab.
+
+    Slots must be handed back with release() once the transfer using them
+    is not submitted anymore.
+    """
+    def __init__(self, slab_size, slab_count, buffer=None):
+        """
+        slab_size (int)
+            Size of each slab, in bytes.
+        slab_count (int)
+            Number of slabs.
+        buffer (writable buffer, None)
+            Memory to carve slabs from, at least slab_size * slab_count
+            bytes long. See USBDeviceHandle.getDeviceMemory.
+            If None, a new bytearray is allocated.
+        """
+        # pylint: disable=redefined-builtin
+        if slab_size <= 0 or slab_count <= 0:
+            raise ValueError('Slab size and count must be positive')
+        self.__slab_size = slab_size
+        if buffer is None:
+            buffer = bytearray(slab_size * slab_count)
+        elif len(buffer) < slab_size * slab_count:
+            raise ValueError('Buffer too small for requested slabs')
+        self.__buffer = buffer_ = buffer
+        # pylint: enable=redefined-builtin
+        view = memoryview(buffer_)
+        slab_type = c_char * slab_size
+        self.__free_list = [
+            _ArenaSlot(
+                slab_type.from_buffer(buffer_, offset),
+                integer_memoryview(view[offset:offset + slab_size]),
+            )
+            for offset in xrange(0, slab_size * slab_count, slab_size)
+        ]
+
+    def getSlabSize(self):
+        """
+        Size of each slab, in bytes.
+        """
+        return self.__slab_size
+
+    def __len__(self):
+        """
+        Number of slabs available for borrowing.
+        """
+        return len(self.__free_list)
+
+    def borrow(self):
+        """
+        Return a free slot.
+        Raises IndexError if all slabs are borrowed.
+        """
+        try:
+            return self.__free_list.pop()
+        except IndexError:
+            raise IndexError('All slabs are borrowed')
+
+    def release(self, slot):
+        """
+        Give back a slot obtained from borrow().
+        """
+        self.__free_list.append(slot)
+
 class DoomedTransferError(Exception):
     """Exception raised when altering/submitting a doomed transfer."""
     pass
@@ -298,10 +659,11 @@ class USBTransfer(object):
     Methods noted as "should not be called on a submitted transfer" will not
     prevent you from reading, but returned value is unspecified.
 
-    Note on user_data: because of pypy's current ctype restrictions, user_data
-    is not provided to C level, but is managed purely in python. It should
-    change nothing for you, unless you are looking at underlying C transfer
-    structure - which you should never have to.
+    Note on user_data: user_data is not provided to C level, but is managed
+    purely in python. At C level, user_data holds a key identifying the
+    python instance, so a single ctypes callback can serve all transfers. It
+    should change nothing for you, unless you are looking at underlying C
+    transfer structure - which you should never have to.
     """
     # Prevent garbage collector from freeing the free function before our
     # instances, as we need it to property destruct them.
@@ -316,13 +678,41 @@ class USBTransfer(object):
     __initialized = False
     __submitted = False
     __callback = None
-    __ctypesCallbackWrapper = None
     __doomed = False
     __user_data = None
     __transfer_buffer = None
     __transfer_py_buffer = None
-
-    def __init__(self, handle, iso_packets, before_submit, after_completion):
+    __recycle = None
+    __completion_queue = None
+    # For isochronous transfers, offset of each packet in buffer, plus total
+    # length.
+    __iso_offset_list = None
+    # All living instances, by the key stored in their libusb_transfer's
+    # user_data.
+    __transfer_dict = weakref.WeakValueDictionary()
+    __transfer_id_iter = itertools.count(1)
+
+    # pylint: disable=no-self-argument
+    def __trampoline(
+            transfer_p,
+            # Avoid globals lookup on call to work during interpreter
+            # shutdown.
+            __transfer_dict=__transfer_dict,
+        ):
+        # pylint: disable=protected-access
+        self = __transfer_dict.get(transfer_p.contents.user_data)
+        if self is not None:
+            self.__callbackWrapper(transfer_p)
+        # pylint: enable=protected-access
+    # pylint: enable=no-self-argument
+    # Shared by all instances: a single ctypes thunk, rather than one per
+    # instance which was creating hard-to-break reference cycles.
+    __ctypesCallbackWrapper = libusb1.libusb_transfer_cb_fn_p(__trampoline)
+    del __trampoline
+
+    def __init__(
+            self, handle, iso_packets, before_submit, after_completion,
+            recycle=None):
         """
         You should not instanciate this class directly.
         Call "getTransfer" method on an USBDeviceHandle instance to get
@@ -335,6 +725,7 @@ class USBTransfer(object):
         self.__handle = handle
         self.__before_submit = before_submit
         self.__after_completion = after_completion
+        self.__recycle = recycle
         self.__num_iso_packets = iso_packets
         result = libusb1.libusb_alloc_transfer(iso_packets)
         if not result:
@@ -342,28 +733,34 @@ class USBTransfer(object):
             raise USBErrorNoMem
             # pylint: enable=undefined-variable
         self.__transfer = result
-        self.__ctypesCallbackWrapper = libusb1.libusb_transfer_cb_fn_p(
-            self.__callbackWrapper)
+        self.__transfer_id = transfer_id = next(self.__transfer_id_iter)
+        self.__transfer_dict[transfer_id] = self
 
     def close(self):
         """
         Break reference cycles to allow instance to be garbage-collected.
         Raises if called on a submitted transfer.
+
+        If this transfer comes from a transfer pool (see
+        USBDeviceHandle.setTransferPoolLimit) and is not doomed, it is reset
+        and handed back to the pool instead of being freed. It must not be
+        used by caller after this method returns.
         """
         if self.__submitted:
             raise ValueError('Cannot close a submitted transfer')
-        self.doom()
         self.__initialized = False
         # Break possible external reference cycles
         self.__callback = None
         self.__user_data = None
-        # Break libusb_transfer reference cycles
-        self.__ctypesCallbackWrapper = None
-        # For some reason, overwriting callback is not enough to remove this
-        # reference cycle - though sometimes it works:
-        #   self -> self.__dict__ -> libusb_transfer -> dict[x] -> dict[x] ->
-        #   CThunkObject -> __callbackWrapper -> self
-        # So free transfer altogether.
+        recycle = self.__recycle
+        if recycle is not None and not self.__doomed:
+            self.__transfer_buffer = None
+            self.__transfer_py_buffer = None
+            self.__iso_offset_list = None
+            if recycle(self.__num_iso_packets, self):
+                return
+        self.doom()
+        self.__recycle = None
         if self.__transfer is not None:
             self.__libusb_free_transfer(self.__transfer)
             self.__transfer = None
@@ -403,9 +800,23 @@ class USBTransfer(object):
         """
         self.__submitted = False
         self.__after_completion(self)
+        completion_queue = self.__completion_queue
+        if completion_queue is not None:
+            completion_queue.append(self)
+            return
         callback = self.__callback
         if callback is not None:
-            callback(self)
+            callback_time = getattr(
+                _event_thread_local, 'callback_time', None,
+            )
+            if callback_time is None:
+                callback(self)
+            else:
+                start = _clock()
+                try:
+                    callback(self)
+                finally:
+                    callback_time[0] += _clock() - start
         if self.__doomed:
             self.close()
     # pylint: enable=unused-argument
@@ -422,6 +833,25 @@ class USBTransfer(object):
         """
         return self.__callback
 
+    def setCompletionQueue(self, queue):
+        """
+        Change transfer's completion queue.
+        queue: an USBCompletionQueue instance, or None.
+
+        When set, upon completion this transfer is only appended to given
+        queue: its callback is not called and, if doomed, it is not closed.
+        Retrieve completed transfers with USBCompletionQueue.drain .
+        """
+        if self.__submitted:
+            raise ValueError('Cannot alter a submitted transfer')
+        self.__completion_queue = queue
+
+    def getCompletionQueue(self):
+        """
+        Get currently set completion queue.
+        """
+        return self.__completion_queue
+
     def setControl(
             self, request_type, request, value, index, buffer_or_len,
             callback=None, user_data=None, timeout=0):
@@ -471,7 +901,7 @@ class USBTransfer(object):
             string_buffer, request_type, request, value, index, length)
         libusb1.libusb_fill_control_transfer(
             self.__transfer, self.__handle, string_buffer,
-            self.__ctypesCallbackWrapper, None, timeout)
+            self.__ctypesCallbackWrapper, self.__transfer_id, timeout)
         self.__callback = callback
         self.__initialized = True
 
@@ -488,7 +918,8 @@ class USBTransfer(object):
             Either a string (when sending data), or expected data length (when
             receiving data)
             To avoid memory copies, use an object implementing the writeable
-            buffer interface (ex: bytearray).
+            buffer interface (ex: bytearray), or a slot borrowed from an
+            USBBufferArena.
         callback
             Callback function to be invoked on transfer completion.
             Called with transfer as parameter, return value ignored.
@@ -509,10 +940,59 @@ class USBTransfer(object):
         self.__user_data = user_data
         libusb1.libusb_fill_bulk_transfer(
             self.__transfer, self.__handle, endpoint, string_buffer,
-            sizeof(string_buffer), self.__ctypesCallbackWrapper, None, timeout)
+            sizeof(string_buffer), self.__ctypesCallbackWrapper,
+            self.__transfer_id, timeout)
+        self.__callback = callback
+        self.__initialized = True
+
+    def setBulkStream(
+            self, endpoint, stream_id, buffer_or_len, callback=None,
+            user_data=None, timeout=0):
+        """
+        Setup transfer for use on a bulk stream (USB 3.0).
+
+        stream_id
+            Stream to submit transfer to, as allocated by
+            USBDeviceHandle.allocStreams .
+        See setBulk for other parameters description.
+
+        Raises AttributeError if libusb does not support bulk streams.
+        """
+        if self.__submitted:
+            raise ValueError('Cannot alter a submitted transfer')
+        if self.__doomed:
+            raise DoomedTransferError('Cannot reuse a doomed transfer')
+        if not hasattr(libusb1, 'libusb_transfer_set_stream_id'):
+            raise AttributeError(
+                'libusb_transfer_set_stream_id not available: libusb does '
+                'not support bulk streams',
+            )
+        string_buffer, self.__transfer_py_buffer = create_binary_buffer(
+            buffer_or_len
+        )
+        self.__initialized = False
+        self.__transfer_buffer = string_buffer
+        self.__user_data = user_data
+        libusb1.libusb_fill_bulk_stream_transfer(
+            self.__transfer, self.__handle, endpoint, stream_id,
+            string_buffer, sizeof(string_buffer),
+            self.__ctypesCallbackWrapper, self.__transfer_id, timeout)
         self.__callback = callback
         self.__initialized = True
 
+    def getStreamID(self):
+        """
+        Get the stream this transfer is set up for, 0 if it is not a bulk
+        stream transfer.
+        """
+        transfer_p = self.__transfer
+        # pylint: disable=undefined-variable
+        if transfer_p.contents.type != TRANSFER_TYPE_BULK_STREAM:
+            # pylint: enable=undefined-variable
+            # libusb keeps stream id, but ignores it for other types.
+            return 0
+        return libusb1.libusb_transfer_get_stream_id(transfer_p)
+
     def setInterrupt(
             self, endpoint, buffer_or_len, callback=None, user_data=None,
             timeout=0):
@@ -526,7 +1006,8 @@ class USBTransfer(object):
             Either a string (when sending data), or expected data length (when
             receiving data)
             To avoid memory copies, use an object implementing the writeable
-            buffer interface (ex: bytearray).
+            buffer interface (ex: bytearray), or a slot borrowed from an
+            USBBufferArena.
         callback
             Callback function to be invoked on transfer completion.
             Called with transfer as parameter, return value ignored.
@@ -547,7 +1028,8 @@ class USBTransfer(object):
         self.__user_data = user_data
         libusb1.libusb_fill_interrupt_transfer(
             self.__transfer, self.__handle, endpoint, string_buffer,
-            sizeof(string_buffer), self.__ctypesCallbackWrapper, None, timeout)
+            sizeof(string_buffer), self.__ctypesCallbackWrapper,
+            self.__transfer_id, timeout)
         self.__callback = callback
         self.__initialized = True
 
@@ -564,7 +1046,8 @@ class USBTransfer(object):
             Either a string (when sending data), or expected data length (when
             receiving data)
             To avoid memory copies, use an object implementing the writeable
-            buffer interface (ex: bytearray).
+            buffer interface (ex: bytearray), or a slot borrowed from an
+            USBBufferArena.
         callback
             Callback function to be invoked on transfer completion.
             Called with transfer as parameter, return value ignored.
@@ -610,30 +1093,37 @@ class USBTransfer(object):
                     num_iso_packets,
                 )
             )
-        if sum(iso_transfer_length_list) > buffer_length:
+        iso_offset_list = [0]
+        append = iso_offset_list.append
+        total_length = 0
+        for length in iso_transfer_length_list:
+            if length <= 0:
+                raise ValueError(
+                    'Negative/null length transfers are not possible.'
+                )
+            total_length += length
+            append(total_length)
+        if total_length > buffer_length:
             raise ValueError(
                 'ISO transfers too long (%i), there are only '
                 '%i bytes available' % (
-                    sum(iso_transfer_length_list),
+                    total_length,
                     buffer_length,
                 )
             )
         transfer_p = self.__transfer
         self.__initialized = False
+        self.__iso_offset_list = iso_offset_list
         self.__transfer_buffer = string_buffer
         self.__transfer_py_buffer = transfer_py_buffer
         self.__user_data = user_data
         libusb1.libusb_fill_iso_transfer(
             transfer_p, self.__handle, endpoint, string_buffer, buffer_length,
-            configured_iso_packets, self.__ctypesCallbackWrapper, None,
-            timeout)
+            configured_iso_packets, self.__ctypesCallbackWrapper,
+            self.__transfer_id, timeout)
         for length, iso_packet_desc in zip(
                 iso_transfer_length_list,
                 libusb1.get_iso_packet_list(transfer_p)):
-            if length <= 0:
-                raise ValueError(
-                    'Negative/null length transfers are not possible.'
-                )
             iso_packet_desc.length = length
         self.__callback = callback
         self.__initialized = True
@@ -647,6 +1137,7 @@ class USBTransfer(object):
             TRANSFER_TYPE_ISOCHRONOUS
             TRANSFER_TYPE_BULK
             TRANSFER_TYPE_INTERRUPT
+            TRANSFER_TYPE_BULK_STREAM
         """
         return self.__transfer.contents.type
 
@@ -677,6 +1168,23 @@ class USBTransfer(object):
         """
         return self.__transfer_py_buffer
 
+    def __getBufferView(self):
+        result = self.__transfer_py_buffer
+        if not isinstance(result, integer_memoryview):
+            result = integer_memoryview(result)
+        return result
+
+    def getBufferView(self):
+        """
+        Get a memoryview of received data, truncated to actual length,
+        without copying it.
+        Returned view shares memory with transfer's buffer, so it must not be
+        used once transfer is resubmitted or closed. Copy it (ex: bytearray,
+        tobytes) to get data ownership.
+        Should not be called on a submitted transfer.
+        """
+        return self.__getBufferView()[:self.__transfer.contents.actual_length]
+
     def getUserData(self):
         """
         Retrieve user data provided on setup.
@@ -689,13 +1197,16 @@ class USBTransfer(object):
         """
         self.__user_data = user_data
 
-    def getISOBufferList(self):
+    def getISOBufferList(self, copy=False):
         """
         Get individual ISO transfer's buffer.
         Returns a list with one item per ISO transfer, with their
         individually-configured sizes.
         Returned list is consistent with getISOSetupList return value.
         Should not be called on a submitted transfer.
+        copy: when false, returned buffers are memoryviews sharing memory
+          with transfer's buffer, so they must not be used once transfer is
+          resubmitted or closed. When true, they are independent bytearrays.
 
         See also iterISO.
         """
@@ -707,7 +1218,40 @@ class USBTransfer(object):
             raise TypeError(
                 'This method cannot be called on non-iso transfers.'
             )
-        return libusb1.get_iso_packet_buffer_list(transfer_p)
+        if copy:
+            return libusb1.get_iso_packet_buffer_list(transfer_p)
+        view = self.__getBufferView()
+        iso_offset_list = self.__iso_offset_list
+        return [
+            view[start:end]
+            for start, end in zip(iso_offset_list, iso_offset_list[1:])
+        ]
+
+    def getISOBuffer(self, index, copy=False):
+        """
+        Get buffer of ISO packet at given index, with its configured size.
+        Packet offsets are computed by setIsochronous, so this does not depend
+        on the number of packets.
+        Should not be called on a submitted transfer.
+        copy: see getISOBufferList.
+        """
+        # pylint: disable=undefined-variable
+        if self.__transfer.contents.type != TRANSFER_TYPE_ISOCHRONOUS:
+            # pylint: enable=undefined-variable
+            raise TypeError(
+                'This method cannot be called on non-iso transfers.'
+            )
+        iso_offset_list = self.__iso_offset_list
+        if index < 0:
+            index += len(iso_offset_list) - 1
+        if not 0 <= index < len(iso_offset_list) - 1:
+            raise IndexError('ISO packet index out of range')
+        result = self.__getBufferView()[
+            iso_offset_list[index]:iso_offset_list[index + 1]
+        ]
+        if copy:
+            result = bytearray(result)
+        return result
 
     def getISOSetupList(self):
         """
@@ -739,13 +1283,42 @@ class USBTransfer(object):
             for x in libusb1.get_iso_packet_list(transfer_p)
         ]
 
-    def iterISO(self):
+    def getISOSetupArray(self):
+        """
+        Get individual ISO transfer's setup, as a numpy structured array with
+        "length", "actual_length" and "status" fields (see getISOSetupList).
+        Requires numpy.
+
+        Returned array is a view on the underlying libusb structure, without
+        any copy: it reflects transfer state as it changes, and must not be
+        used once transfer is closed. Do not modify "length" values, use
+        setIsochronous instead.
+        Should not be called on a submitted transfer (except for 'length'
+        values).
+        """
+        try:
+            # Imported on first use, as numpy is large and only useful to
+            # some applications.
+            from numpy.ctypeslib import as_array
+        except ImportError:
+            raise NotImplementedError('numpy is not available')
+        transfer_p = self.__transfer
+        # pylint: disable=undefined-variable
+        if transfer_p.contents.type != TRANSFER_TYPE_ISOCHRONOUS:
+            # pylint: enable=undefined-variable
+            raise TypeError(
+                'This method cannot be called on non-iso transfers.'
+            )
+        return as_array(libusb1.get_iso_packet_list(transfer_p))
+
+    def iterISO(self, copy=False):
         """
         Generator yielding (status, buffer) for each isochornous transfer.
         buffer is truncated to actual_length.
         This is more efficient than calling both getISOBufferList and
         getISOSetupList when receiving data.
         Should not be called on a submitted transfer.
+        copy: see getISOBufferList.
         """
         transfer_p = self.__transfer
         transfer = transfer_p.contents
@@ -755,18 +1328,20 @@ class USBTransfer(object):
             raise TypeError(
                 'This method cannot be called on non-iso transfers.'
             )
-        buffer_position = transfer.buffer
-        for iso_transfer in libusb1.get_iso_packet_list(transfer_p):
-            yield (
-                iso_transfer.status,
-                libusb1.buffer_at(buffer_position, iso_transfer.actual_length),
-            )
-            buffer_position += iso_transfer.length
+        view = self.__getBufferView()
+        for offset, iso_transfer in zip(
+                self.__iso_offset_list,
+                libusb1.get_iso_packet_list(transfer_p)):
+            data = view[offset:offset + iso_transfer.actual_length]
+            if copy:
+                data = bytearray(data)
+            yield iso_transfer.status, data
 
     def setBuffer(self, buffer_or_len):
         """
         Replace buffer with a new one.
         Allows resizing read buffer and replacing data sent.
+        buffer_or_len accepts the same values as setBulk's.
         Note: resizing is not allowed for isochronous buffer (use
         setIsochronous).
         Note: disallowed on control transfers (use setControl).
@@ -794,6 +1369,62 @@ class USBTransfer(object):
         transfer.buffer = cast(buff, c_void_p)
         transfer.length = sizeof(buff)
 
+    def rearm(self, data_or_len=None):
+        """
+        Prepare transfer for resubmission, keeping its setup and buffer.
+        data_or_len
+            None to keep current length, an integer to change transfer
+            length, or data to copy at the start of current buffer (transfer
+            length becoming data length).
+        Unlike setBuffer and setters, this does not allocate a new buffer:
+        new length cannot exceed the size of the buffer given to last setter
+        or setBuffer call.
+        Note: changing length is not allowed for isochronous transfers (use
+        setIsochronous).
+        Note: disallowed on control transfers (use setControl).
+        """
+        if self.__submitted:
+            raise ValueError('Cannot alter a submitted transfer')
+        if self.__doomed:
+            raise DoomedTransferError('Cannot reuse a doomed transfer')
+        if not self.__initialized:
+            raise ValueError(
+                'Cannot rearm a transfer which has not been set up'
+            )
+        if data_or_len is None:
+            return
+        transfer = self.__transfer.contents
+        # pylint: disable=undefined-variable
+        if transfer.type == TRANSFER_TYPE_CONTROL:
+            # pylint: enable=undefined-variable
+            raise ValueError(
+                'To alter control transfer buffer, use setControl'
+            )
+        if isinstance(data_or_len, (int, long)):
+            data = None
+            length = data_or_len
+        else:
+            data = _getByteView(data_or_len)
+            length = len(data)
+        if length > sizeof(self.__transfer_buffer):
+            raise ValueError(
+                'Length %i exceeds buffer size %i' % (
+                    length,
+                    sizeof(self.__transfer_buffer),
+                )
+            )
+        # pylint: disable=undefined-variable
+        if transfer.type == TRANSFER_TYPE_ISOCHRONOUS and \
+                length != transfer.length:
+            # pylint: enable=undefined-variable
+            raise ValueError(
+                'To alter isochronous transfer buffer length, use '
+                'setIsochronous'
+            )
+        if data is not None:
+            self.__transfer_py_buffer[:length] = data
+        transfer.length = length
+
     def isSubmitted(self):
         """
         Tells if this transfer is submitted and still pending.
@@ -833,40 +1464,137 @@ class USBTransfer(object):
             raise self.__USBErrorNotFound
         self.__mayRaiseUSBError(self.__libusb_cancel_transfer(self.__transfer))
 
-class USBTransferHelper(object):
+class _TransferPool(object):
     """
-    Simplifies subscribing to the same transfer over and over, and callback
-    handling:
-    - no need to read event status to execute apropriate code, just setup
-      different functions for each status code
-    - just return True instead of calling submit
-    - no need to check if transfer is doomed before submitting it again,
-      DoomedTransferError is caught.
-
-    Callbacks used in this class must follow the callback API described in
-    USBTransfer, and are expected to return a boolean:
-    - True if transfer is to be submitted again (to receive/send more data)
-    - False otherwise
+    Idle USBTransfer instances, grouped by their number of isochronous packet
+    descriptors.
 
-    Note: as per libusb1 specifications, isochronous transfer global state
-    might be TRANSFER_COMPLETED although some individual packets might
-    have an error status. You can check individual packet status by calling
-    getISOSetupList on transfer object in your callback.
+    Not protected by a lock: list.append and list.pop are atomic, so the worst
+    a race can cause is a pool slightly exceeding its limit or slightly
+    inaccurate counters.
     """
-    def __init__(self, transfer=None):
-        """
-        Create a transfer callback dispatcher.
+    limit = 0
+    hit_count = 0
+    miss_count = 0
+    discard_count = 0
 
-        transfer parameter is deprecated. If provided, it will be equivalent
-        to:
-            helper = USBTransferHelper()
-            transfer.setCallback(helper)
-        and also allows using deprecated methods on this class (otherwise,
-        they raise AttributeError).
+    def __init__(self):
+        self.__pool_dict = {}
+
+    def get(self, iso_packets):
         """
-        if transfer is not None:
-            # Deprecated: to drop
-            self.__transfer = transfer
+        Return an idle transfer with given number of iso packets, or None if
+        there is none.
+        """
+        try:
+            result = self.__pool_dict[iso_packets].pop()
+        except (KeyError, IndexError):
+            self.miss_count += 1
+            return None
+        self.hit_count += 1
+        return result
+
+    def put(self, iso_packets, transfer):
+        """
+        Offer a closed transfer to the pool.
+        Returns whether transfer was accepted. If not, caller must free it.
+        A transfer already in the pool (ex: closed twice) is accepted without
+        being added again, so it cannot be handed out twice.
+        """
+        transfer_list = self.__pool_dict.setdefault(iso_packets, [])
+        for pooled_transfer in transfer_list:
+            if pooled_transfer is transfer:
+                return True
+        if len(transfer_list) >= self.limit:
+            self.discard_count += 1
+            return False
+        transfer_list.append(transfer)
+        return True
+
+    def trim(self):
+        """
+        Free idle transfers in excess of current limit.
+        """
+        limit = self.limit
+        for transfer_list in self.__pool_dict.values():
+            while len(transfer_list) > limit:
+                transfer = transfer_list.pop()
+                transfer.doom()
+                transfer.close()
+
+    def clear(self):
+        """
+        Forget all idle transfers, without freeing them.
+        """
+        self.__pool_dict.clear()
+
+    def __len__(self):
+        return sum(len(x) for x in self.__pool_dict.values())
+
+class USBCompletionQueue(collections.deque):
+    """
+    Completed transfers, in completion order.
+
+    Set on transfers (see USBTransfer.setCompletionQueue and
+    USBDeviceHandle.setCompletionQueue) so that the thread handling libusb
+    events only appends them here, and completions can be processed in
+    batches, possibly from another thread. One instance may be shared by
+    several device handles.
+    """
+    def drain(self, max_n=None):
+        """
+        Remove and return a list of completed transfers, oldest first.
+        max_n: maximum number of transfers to return. If None, return all
+          transfers queued when called.
+
+        It is up to the caller to resubmit or close returned transfers.
+        """
+        if max_n is None:
+            max_n = len(self)
+        result = []
+        append = result.append
+        popleft = self.popleft
+        try:
+            for _ in xrange(max_n):
+                append(popleft())
+        except IndexError:
+            pass
+        return result
+
+class USBTransferHelper(object):
+    """
+    Simplifies subscribing to the same transfer over and over, and callback
+    handling:
+    - no need to read event status to execute apropriate code, just setup
+      different functions for each status code
+    - just return True instead of calling submit
+    - no need to check if transfer is doomed before submitting it again,
+      DoomedTransferError is caught.
+
+    Callbacks used in this class must follow the callback API described in
+    USBTransfer, and are expected to return a boolean:
+    - True if transfer is to be submitted again (to receive/send more data)
+    - False otherwise
+
+    Note: as per libusb1 specifications, isochronous transfer global state
+    might be TRANSFER_COMPLETED although some individual packets might
+    have an error status. You can check individual packet status by calling
+    getISOSetupList on transfer object in your callback.
+    """
+    def __init__(self, transfer=None):
+        """
+        Create a transfer callback dispatcher.
+
+        transfer parameter is deprecated. If provided, it will be equivalent
+        to:
+            helper = USBTransferHelper()
+            transfer.setCallback(helper)
+        and also allows using deprecated methods on this class (otherwise,
+        they raise AttributeError).
+        """
+        if transfer is not None:
+            # Deprecated: to drop
+            self.__transfer = transfer
             transfer.setCallback(self)
         self.__event_callback_dict = {}
         self.__errorCallback = DEFAULT_ASYNC_TRANSFER_ERROR_CALLBACK
@@ -936,6 +1664,779 @@ class USBTransferHelper(object):
         # Deprecated: to drop
         return self.__transfer.isSubmitted()
 
+class _TransferStream(object):
+    """
+    Base class for streaming helpers.
+
+    Owns a fixed set of transfers, each given its own slab of a
+    USBBufferArena, and keeps transfer & byte counters.
+    Subclasses configure transfers with _onTransferCompletion as callback.
+    """
+    _running = False
+    _error = None
+    _start_time = None
+    _stop_time = None
+
+    def __init__(self, handle, context, depth, length, iso_packets=0):
+        if depth < 1:
+            raise ValueError('depth must be positive')
+        self._context = context
+        # Set by subclasses' completion callbacks, for _pump.
+        self._completed = c_int()
+        self._arena = USBBufferArena(length, depth)
+        self._transfer_list = transfer_list = [
+            handle.getTransfer(iso_packets) for _ in xrange(depth)
+        ]
+        for transfer in transfer_list:
+            # Completions are handled by this class, not by handle's queue.
+            transfer.setCompletionQueue(None)
+        self._transfer_count = 0
+        self._byte_count = 0
+        self._underrun_count = 0
+
+    def _start(self):
+        if self._running:
+            raise ValueError('Already started')
+        self._error = None
+        self._running = True
+        self._start_time = _clock()
+        self._stop_time = None
+
+    def _submit(self, transfer):
+        """
+        Submit given transfer, stopping streaming on failure.
+        Returns whether transfer got submitted.
+        """
+        try:
+            transfer.submit()
+        except (USBError, DoomedTransferError):
+            self._fail(sys.exc_info()[1])
+            return False
+        return True
+
+    def _fail(self, error):
+        """
+        Stop streaming because of given exception, to be raised to caller
+        later.
+        """
+        if self._error is None:
+            self._error = error
+        self.stop(wait=False)
+
+    def _hasSubmitted(self):
+        for transfer in self._transfer_list:
+            if transfer.isSubmitted():
+                return True
+        return False
+
+    def _pump(self, predicate, timeout=None):
+        """
+        Handle USB events until predicate returns a true value or timeout (in
+        seconds, None to wait forever) expires.
+        Returns predicate's last value.
+        """
+        return _handleEventsUntil(
+            self._context, predicate, self._completed, timeout,
+        )
+
+    def getError(self):
+        """
+        Returns the exception which stopped streaming, if any.
+        """
+        return self._error
+
+    def isRunning(self):
+        """
+        Tells whether streaming is in progress, or transfers are still
+        submitted.
+        """
+        return self._running or self._hasSubmitted()
+
+    def stop(self, wait=True):
+        """
+        Stop streaming: cancel all submitted transfers.
+        wait (bool)
+            When true, handle USB events until all transfers are actually
+            cancelled.
+        """
+        if self._running:
+            self._running = False
+            self._stop_time = _clock()
+        for transfer in self._transfer_list:
+            try:
+                transfer.cancel()
+            # pylint: disable=undefined-variable
+            except (USBErrorNotFound, USBErrorNoDevice):
+                # pylint: enable=undefined-variable
+                pass
+        if wait:
+            self._pump(lambda: not self._hasSubmitted())
+
+    def close(self):
+        """
+        Stop streaming and release transfers.
+        """
+        self.stop()
+        transfer_list = self._transfer_list
+        while transfer_list:
+            transfer_list.pop().close()
+
+    def getStatistics(self):
+        """
+        Returns a dict describing streaming activity since last start:
+        - transfers: number of completed transfers
+        - bytes: number of bytes transferred
+        - underruns: number of times a transfer completed while no other
+          transfer was submitted, meaning the endpoint was idle. If this
+          happens, consider increasing depth.
+        - elapsed: streaming duration, in seconds
+        - throughput: average bytes per second
+        """
+        start_time = self._start_time
+        if start_time is None:
+            elapsed = 0
+        else:
+            elapsed = (self._stop_time or _clock()) - start_time
+        byte_count = self._byte_count
+        return {
+            'transfers': self._transfer_count,
+            'bytes': byte_count,
+            'underruns': self._underrun_count,
+            'elapsed': elapsed,
+            'throughput': elapsed and byte_count / elapsed,
+        }
+
+class _TransferReader(_TransferStream):
+    """
+    Base class for streaming helpers receiving data.
+
+    Received data is either given to a callback, or queued for read().
+    """
+    def __init__(
+            self, handle, context, depth, length, callback, iso_packets=0):
+        super(_TransferReader, self).__init__(
+            handle, context, depth, length, iso_packets,
+        )
+        self._callback = callback
+        self._queue = collections.deque()
+
+    def start(self):
+        """
+        Submit all transfers.
+        """
+        self._start()
+        submit = self._submit
+        for transfer in self._transfer_list:
+            if not submit(transfer):
+                # Streaming stopped.
+                break
+
+    def read(self, timeout=None):
+        """
+        Return the next received data chunk, as bytes.
+        Can only be used if no callback was given.
+
+        Handles USB events while waiting for data, so it can be used without
+        a separate event-handling thread.
+        timeout (float, None)
+            How long to wait for data, in seconds. None to wait forever.
+        Returns None on timeout, or if reader is stopped and all received data
+        has been read.
+        Raises the error which stopped the reader, if any, once all data
+        received before the error has been read.
+        """
+        if self._callback is not None:
+            raise ValueError('Cannot read when a callback is set')
+        queue = self._queue
+        self._pump(lambda: queue or not self.isRunning(), timeout)
+        try:
+            return queue.popleft()
+        except IndexError:
+            error = self._error
+            if error is not None:
+                self._error = None
+                raise error
+        return None
+
+class USBBulkReader(_TransferReader):
+    """
+    Continuously read from a bulk IN endpoint, keeping a fixed number of
+    transfers submitted so the endpoint is never left idle.
+
+    Transfers are resubmitted from their completion callback, and received
+    data is delivered in reception order, either:
+    - to a callback, called from the thread handling USB events with a
+      memoryview of received data. This memoryview is only valid until
+      callback returns, as its buffer is reused on resubmission.
+    - to an internal queue, which is emptied by calling read(). Received
+      data is copied, and the transfer resubmitted before data is queued.
+      The queue is not bounded, so data must be read as fast as it arrives.
+
+    Timed out transfers deliver whatever data they received and get
+    resubmitted. Any other transfer error stops the reader, and is raised by
+    read() once all data received before it has been read.
+
+    Get instances by calling USBDeviceHandle.getBulkReader.
+    """
+    def __init__(
+            self, handle, context, endpoint, length, depth, timeout,
+            callback):
+        """
+        You should not instanciate this class directly.
+        Call "getBulkReader" method on an USBDeviceHandle instance to get
+        instances of this class.
+        """
+        super(USBBulkReader, self).__init__(
+            handle, context, depth, length, callback,
+        )
+        # pylint: disable=undefined-variable
+        endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
+        # pylint: enable=undefined-variable
+        borrow = self._arena.borrow
+        for transfer in self._transfer_list:
+            transfer.setBulk(
+                endpoint, borrow(), callback=self.__onTransferCompletion,
+                timeout=timeout,
+            )
+
+    def __onTransferCompletion(self, transfer):
+        self._completed.value = 1
+        status = transfer.getStatus()
+        # pylint: disable=undefined-variable
+        if status != TRANSFER_COMPLETED and status != TRANSFER_TIMED_OUT:
+            if status != TRANSFER_CANCELLED:
+                # pylint: enable=undefined-variable
+                self._fail(getTransferStatusError(status))
+            return
+        running = self._running
+        if running and not self._hasSubmitted():
+            self._underrun_count += 1
+        length = transfer.getActualLength()
+        self._transfer_count += 1
+        self._byte_count += length
+        callback = self._callback
+        if callback is None:
+            data = transfer.getBuffer()[:length].tobytes()
+            if running:
+                self._submit(transfer)
+            if data:
+                self._queue.append(data)
+        else:
+            callback(transfer.getBuffer()[:length])
+            if running:
+                self._submit(transfer)
+
+class USBBulkWriter(_TransferStream):
+    """
+    Send data to a bulk OUT endpoint, keeping up to a fixed number of
+    transfers submitted.
+
+    write() copies data into the buffer of an idle transfer (see
+    USBTransfer.rearm) and submits it.
+    When all transfers are submitted, it handles USB events until one
+    completes, which provides backpressure to the producer. flush() waits
+    for all submitted transfers to complete.
+    Transfer buffers are allocated once, so steady-state writes do not
+    allocate transfer memory.
+
+    Any transfer error stops the writer (cancelling other submitted
+    transfers), and is raised by next write() or flush() call.
+
+    Get instances by calling USBDeviceHandle.getBulkWriter.
+    """
+    def __init__(self, handle, context, endpoint, length, depth, timeout):
+        """
+        You should not instanciate this class directly.
+        Call "getBulkWriter" method on an USBDeviceHandle instance to get
+        instances of this class.
+        """
+        super(USBBulkWriter, self).__init__(handle, context, depth, length)
+        # pylint: disable=undefined-variable
+        endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_OUT
+        # pylint: enable=undefined-variable
+        self.__length = length
+        self.__blocked_count = 0
+        self.__idle_list = idle_list = []
+        borrow = self._arena.borrow
+        for transfer in self._transfer_list:
+            transfer.setBulk(
+                endpoint, borrow(), callback=self.__onTransferCompletion,
+                timeout=timeout,
+            )
+            idle_list.append(transfer)
+
+    def __onTransferCompletion(self, transfer):
+        self._completed.value = 1
+        self.__idle_list.append(transfer)
+        status = transfer.getStatus()
+        # pylint: disable=undefined-variable
+        if status != TRANSFER_COMPLETED:
+            if status != TRANSFER_CANCELLED:
+                # pylint: enable=undefined-variable
+                self._fail(getTransferStatusError(status))
+            return
+        if self._running and not self._hasSubmitted():
+            self._underrun_count += 1
+        self._transfer_count += 1
+        self._byte_count += transfer.getActualLength()
+
+    def __raiseError(self):
+        error = self._error
+        if error is not None:
+            self._error = None
+            raise error
+
+    def write(self, data, timeout=None):
+        """
+        Queue data for sending.
+        Data longer than transfer length is split among several transfers.
+
+        timeout (float, None)
+            How long to wait for idle transfers, in seconds. None to wait
+            forever.
+        Returns the number of bytes queued, which is less than data length
+        if timeout expired.
+        """
+        self.__raiseError()
+        if not self._running:
+            self._start()
+        if timeout is None:
+            deadline = None
+        else:
+            deadline = _clock() + timeout
+        idle_list = self.__idle_list
+        has_idle = lambda: idle_list or self._error is not None
+        length = self.__length
+        data = _getByteView(data)
+        data_length = len(data)
+        offset = 0
+        while offset < data_length:
+            if not idle_list:
+                self.__blocked_count += 1
+                if not self._pump(
+                        has_idle,
+                        None if deadline is None else deadline - _clock(),
+                    ):
+                    break
+                self.__raiseError()
+            transfer = idle_list.pop()
+            chunk = data[offset:offset + length]
+            chunk_length = len(chunk)
+            transfer.rearm(chunk)
+            if not self._submit(transfer):
+                # Not submitted, so it will not complete: still idle.
+                idle_list.append(transfer)
+            self.__raiseError()
+            offset += chunk_length
+        return offset
+
+    def flush(self, timeout=None):
+        """
+        Wait for all submitted transfers to complete.
+
+        timeout (float, None)
+            How long to wait, in seconds. None to wait forever.
+        Returns whether all transfers completed.
+        """
+        result = self._pump(
+            lambda: not self._hasSubmitted() or self._error is not None,
+            timeout,
+        )
+        self.__raiseError()
+        return bool(result)
+
+    def getStatistics(self):
+        """
+        See USBBulkReader.getStatistics. Also contains:
+        - blocked: number of times write() had to wait for a transfer to
+          complete.
+        """
+        result = super(USBBulkWriter, self).getStatistics()
+        result['blocked'] = self.__blocked_count
+        return result
+
+class USBIsochronousReader(_TransferReader):
+    """
+    Continuously read from an isochronous IN endpoint, keeping a fixed number
+    of transfers submitted so no service interval goes without a transfer.
+
+    Each transfer is set up once, with packet_count packets of packet_size
+    bytes, and keeps its buffer and packet layout when resubmitted from its
+    completion callback. Received packet payloads are delivered in reception
+    order, as with USBBulkReader: either to a callback (called once per
+    packet with a memoryview only valid until callback returns), or to a
+    queue emptied by read() (one bytes object per packet).
+
+    Packets are counted, but not delivered, when:
+    - errored: packet status is not TRANSFER_COMPLETED
+    - missed: packet is empty, no data was received in its service interval
+    Packets smaller than packet_size are delivered, and counted as short.
+    Any transfer error stops the reader, as with USBBulkReader.
+
+    Get instances by calling USBDeviceHandle.getIsochronousReader.
+    """
+    _packet_count = 0
+    _errored_packet_count = 0
+    _missed_packet_count = 0
+    _short_packet_count = 0
+    _resubmit_count = 0
+    _resubmit_latency_total = 0
+    _resubmit_latency_max = 0
+
+    def __init__(
+            self, handle, context, endpoint, packet_size, packet_count, depth,
+            timeout, callback):
+        """
+        You should not instanciate this class directly.
+        Call "getIsochronousReader" method on an USBDeviceHandle instance to
+        get instances of this class.
+        """
+        super(USBIsochronousReader, self).__init__(
+            handle, context, depth, packet_size * packet_count, callback,
+            packet_count,
+        )
+        # pylint: disable=undefined-variable
+        endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
+        # pylint: enable=undefined-variable
+        self.__packet_size = packet_size
+        borrow = self._arena.borrow
+        for transfer in self._transfer_list:
+            transfer.setIsochronous(
+                endpoint, borrow(), callback=self.__onTransferCompletion,
+                timeout=timeout,
+            )
+
+    def __onTransferCompletion(self, transfer):
+        self._completed.value = 1
+        completion_time = _clock()
+        status = transfer.getStatus()
+        # pylint: disable=undefined-variable
+        if status != TRANSFER_COMPLETED:
+            if status != TRANSFER_CANCELLED:
+                # pylint: enable=undefined-variable
+                self._fail(getTransferStatusError(status))
+            return
+        running = self._running
+        if running and not self._hasSubmitted():
+            self._underrun_count += 1
+        packet_size = self.__packet_size
+        callback = self._callback
+        data_list = []
+        append = data_list.append
+        packet_count = byte_count = errored_count = missed_count = \
+            short_count = 0
+        for packet_status, data in transfer.iterISO():
+            packet_count += 1
+            # pylint: disable=undefined-variable
+            if packet_status != TRANSFER_COMPLETED:
+                # pylint: enable=undefined-variable
+                errored_count += 1
+                continue
+            length = len(data)
+            if not length:
+                missed_count += 1
+                continue
+            if length < packet_size:
+                short_count += 1
+            byte_count += length
+            if callback is None:
+                append(data.tobytes())
+            else:
+                callback(data)
+        if running:
+            self._submit(transfer)
+            latency = _clock() - completion_time
+            self._resubmit_count += 1
+            self._resubmit_latency_total += latency
+            if latency > self._resubmit_latency_max:
+                self._resubmit_latency_max = latency
+        self._transfer_count += 1
+        self._byte_count += byte_count
+        self._packet_count += packet_count
+        self._errored_packet_count += errored_count
+        self._missed_packet_count += missed_count
+        self._short_packet_count += short_count
+        if data_list:
+            self._queue.extend(data_list)
+
+    def getStatistics(self):
+        """
+        Returns a dict describing streaming activity, with the same keys as
+        USBBulkReader.getStatistics plus:
+        - packets: number of packets in completed transfers
+        - errored_packets, missed_packets, short_packets: number of such
+          packets, see class docstring
+        - resubmit_latency: average delay, in seconds, between a transfer
+          completion and its resubmission
+        - resubmit_latency_max: longest such delay, in seconds
+        """
+        result = super(USBIsochronousReader, self).getStatistics()
+        resubmit_count = self._resubmit_count
+        result.update({
+            'packets': self._packet_count,
+            'errored_packets': self._errored_packet_count,
+            'missed_packets': self._missed_packet_count,
+            'short_packets': self._short_packet_count,
+            'resubmit_latency': resubmit_count and (
+                self._resubmit_latency_total / resubmit_count
+            ),
+            'resubmit_latency_max': self._resubmit_latency_max,
+        })
+        return result
+
+class USBIsochronousWriter(_TransferStream):
+    """
+    Continuously send data to an isochronous OUT endpoint, keeping a fixed
+    number of transfers submitted so no service interval goes without a
+    transfer.
+
+    Each transfer is set up once, with packet_count packets of packet_size
+    bytes, and is refilled in place then resubmitted from its completion
+    callback. Data comes either from:
+    - a producer callback, called from the thread handling USB events with
+      a writable memoryview of the whole transfer buffer. It must fill it
+      from its start, and return the number of bytes it filled.
+    - an internal buffer, fed by calling write(). write() may be called
+      from any thread, including while the thread handling USB events
+      copies data out of the internal buffer.
+    When less data than transfer length is available, transfer is completed
+    with zeroes and the producer is counted as late.
+
+    start() fills all transfers before submitting them, so that the time
+    spent producing initial data does not delay the first submissions.
+    Any transfer error stops the writer, and is raised by next write() call.
+
+    Get instances by calling USBDeviceHandle.getIsochronousWriter.
+    """
+    _late_count = 0
+    _errored_packet_count = 0
+
+    def __init__(
+            self, handle, context, endpoint, packet_size, packet_count, depth,
+            timeout, producer):
+        """
+        You should not instanciate this class directly.
+        Call "getIsochronousWriter" method on an USBDeviceHandle instance to
+        get instances of this class.
+        """
+        length = packet_size * packet_count
+        super(USBIsochronousWriter, self).__init__(
+            handle, context, depth, length, packet_count,
+        )
+        # pylint: disable=undefined-variable
+        endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_OUT
+        # pylint: enable=undefined-variable
+        self.__producer = producer
+        self.__fifo = bytearray()
+        # Held while fifo is exported or resized.
+        self.__fifo_lock = threading.Lock()
+        self.__silence = memoryview(bytearray(length))
+        borrow = self._arena.borrow
+        for transfer in self._transfer_list:
+            slot = borrow()
+            transfer.setIsochronous(
+                endpoint, slot, callback=self.__onTransferCompletion,
+                user_data=slot, timeout=timeout,
+            )
+
+    def __fill(self, transfer):
+        """
+        Fill given transfer's buffer.
+        Raises ValueError if producer does not return a valid length.
+        """
+        data = transfer.getUserData().buffer
+        data_length = len(data)
+        producer = self.__producer
+        if producer is None:
+            fifo = self.__fifo
+            with self.__fifo_lock:
+                length = min(len(fifo), data_length)
+                # Copy through a view, to not allocate a temporary bytearray.
+                fifo_view = memoryview(fifo)
+                data[:length] = fifo_view[:length]
+                # Release fifo so it can be resized.
+                del fifo_view
+                del fifo[:length]
+        else:
+            length = producer(data)
+            if not isinstance(length, (int, long)) or \
+                    not 0 <= length <= data_length:
+                raise ValueError(
+                    'producer must return the number of bytes it filled, '
+                    'between 0 and %i, got %r' % (data_length, length),
+                )
+        if length < data_length:
+            self._late_count += 1
+            data[length:] = self.__silence[length:]
+
+    def __onTransferCompletion(self, transfer):
+        self._completed.value = 1
+        status = transfer.getStatus()
+        # pylint: disable=undefined-variable
+        if status != TRANSFER_COMPLETED:
+            if status != TRANSFER_CANCELLED:
+                # pylint: enable=undefined-variable
+                self._fail(getTransferStatusError(status))
+            return
+        running = self._running
+        if running and not self._hasSubmitted():
+            self._underrun_count += 1
+        byte_count = errored_count = 0
+        for packet_status, data in transfer.iterISO():
+            # pylint: disable=undefined-variable
+            if packet_status == TRANSFER_COMPLETED:
+                # pylint: enable=undefined-variable
+                byte_count += len(data)
+            else:
+                errored_count += 1
+        self._transfer_count += 1
+        self._byte_count += byte_count
+        self._errored_packet_count += errored_count
+        if running:
+            try:
+                self.__fill(transfer)
+            except ValueError:
+                self._fail(sys.exc_info()[1])
+                return
+            self._submit(transfer)
+
+    def start(self):
+        """
+        Fill all transfers, then submit them.
+        Raises ValueError if producer does not return a valid length.
+        """
+        self._start()
+        transfer_list = self._transfer_list
+        for transfer in transfer_list:
+            try:
+                self.__fill(transfer)
+            except ValueError:
+                self._fail(sys.exc_info()[1])
+                self._error = None
+                raise
+        submit = self._submit
+        for transfer in transfer_list:
+            if not submit(transfer):
+                # Streaming stopped.
+                break
+
+    def write(self, data):
+        """
+        Append data to the internal buffer, to be sent as transfers complete.
+        Can only be used if no producer was given.
+        """
+        if self.__producer is not None:
+            raise ValueError('Cannot write when a producer is set')
+        error = self._error
+        if error is not None:
+            self._error = None
+            raise error
+        with self.__fifo_lock:
+            self.__fifo += data
+
+    def getBufferedLength(self):
+        """
+        Returns the number of bytes written but not yet copied into a
+        transfer.
+        """
+        return len(self.__fifo)
+
+    def getStatistics(self):
+        """
+        See USBBulkReader.getStatistics. Also contains:
+        - late: number of transfers which could not be filled completely,
+          because producer was late.
+        - errored_packets: number of packets which failed to be sent.
+        """
+        result = super(USBIsochronousWriter, self).getStatistics()
+        result['late'] = self._late_count
+        result['errored_packets'] = self._errored_packet_count
+        return result
+
+class USBEventThread(threading.Thread):
+    """
+    Thread handling events of an USBContext, in which transfer callbacks
+    are executed. Other threads are free to use the synchronous API and to
+    submit transfers.
+
+    Call stop() before closing the context.
+    """
+    def __init__(self, context, exc_callback=None, timeout=1):
+        """
+        Create an event thread for given context.
+
+        exc_callback (callable)
+          Called with the USBError as single parameter when event handling
+          fails.
+          If not given, the USBError will be raised, interrupting the thread.
+        timeout (float)
+          Maximum time, in seconds, to wait for an event before checking if
+          the thread should stop. Only matters if libusb is too old to
+          provide libusb_interrupt_event_handler.
+        """
+        super(USBEventThread, self).__init__()
+        self.daemon = True
+        self.__context = context
+        self.__timeout = timeout
+        self.__stop = c_int()
+        self.__iteration_count = 0
+        self.__callback_time = [0]
+        self.__exception_count = 0
+        if exc_callback is not None:
+            self.exceptionHandler = exc_callback
+
+    def stop(self):
+        """
+        Stop & join thread.
+        """
+        self.__stop.value = 1
+        try:
+            self.__context.interruptEventHandler()
+        except AttributeError:
+            # libusb_interrupt_event_handler not available, thread will
+            # notice within timeout.
+            pass
+        if threading.current_thread() is not self:
+            self.join()
+
+    # pylint: disable=method-hidden
+    @staticmethod
+    def exceptionHandler(exc):
+        raise exc
+    # pylint: enable=method-hidden
+
+    def getStatistics(self):
+        """
+        Returns a dict describing event handling activity:
+        - iterations: number of event handling calls
+        - handling_time: total time spent in transfer callbacks, in
+          seconds. Time spent waiting for events is not included.
+        - exceptions: number of event handling calls which failed
+        """
+        return {
+            'iterations': self.__iteration_count,
+            'handling_time': self.__callback_time[0],
+            'exceptions': self.__exception_count,
+        }
+
+    def run(self):
+        handle_events = self.__context.handleEventsTimeoutCompleted
+        timeout = self.__timeout
+        stop = self.__stop
+        _event_thread_local.callback_time = self.__callback_time
+        while not stop.value:
+            try:
+                handle_events(timeout, stop)
+            # pylint: disable=undefined-variable
+            except USBErrorInterrupted:
+                # pylint: enable=undefined-variable
+                pass
+            except USBError:
+                self.__exception_count += 1
+                self.exceptionHandler(sys.exc_info()[1])
+            finally:
+                self.__iteration_count += 1
+
 # BBB
 class USBPollerThread(threading.Thread):
     """
@@ -969,7 +2470,7 @@ class USBPollerThread(threading.Thread):
         warnings.warn(
             'USBPollerThread causes long stalls when used with poll (it was '
             'intended for epoll), and is generally misleading. Consider '
-            'calling looping over context.handleEvents() in a thread instead.',
+            'using USBEventThread instead.',
             DeprecationWarning,
         )
         self.daemon = True
@@ -1138,6 +2639,221 @@ class USBPoller(object):
         self.unregister(fd)
     # pylint: enable=unused-argument
 
+# libusb uses poll() event flags, which are not exposed by select module on
+# all platforms.
+_POLLIN = getattr(select, 'POLLIN', 1)
+_POLLOUT = getattr(select, 'POLLOUT', 4)
+
+class USBAsyncioPoller(object):
+    """
+    Class integrating USB event handling in an asyncio event loop.
+
+    libusb file descriptors are registered with the loop's add_reader and
+    add_writer, and kept up-to-date with USBContext.setPollFDNotifiers.
+    libusb timeouts are scheduled with the loop's call_at. USB events are only
+    handled, without blocking, when a descriptor is ready or a timeout
+    expires, so no event-handling thread is needed.
+
+    WARNING: only use from the thread running the event loop. Do not mix with
+    another USBPoller, USBPollerThread or USBAsyncioPoller on the same
+    context.
+    Note: on platforms where libusb does not use a file descriptor for its
+    timeouts, call refreshTimeout after submitting a transfer having a
+    timeout, so the loop learns about it.
+    """
+    __timer = None
+
+    def __init__(self, context, loop=None):
+        """
+        Create an asyncio poller for given context.
+        Warning: it will not check if another poller instance was already
+        present for that context, and will replace it.
+
+        loop
+            Event loop to integrate with. Defaults to the event loop running
+            in current thread. Required when no event loop is running.
+        """
+        if asyncio is None:
+            raise NotImplementedError('asyncio is not available')
+        if loop is None:
+            loop = _getDefaultLoop()
+        self.__context = context
+        self.__loop = loop
+        self.__fd_dict = {}
+        context.setPollFDNotifiers(self._registerFD, self._unregisterFD)
+        for fd, events in context.getPollFDList():
+            self._registerFD(fd, events)
+        self.refreshTimeout()
+
+    def close(self):
+        """
+        Remove USB file descriptors and timeouts from event loop.
+        """
+        self.__context.setPollFDNotifiers(None, None)
+        for fd in list(self.__fd_dict):
+            self._unregisterFD(fd)
+        timer = self.__timer
+        if timer is not None:
+            timer.cancel()
+            self.__timer = None
+
+    def getLoop(self):
+        """
+        Returns the event loop this instance is integrated with.
+        """
+        return self.__loop
+
+    def __handleEvents(self):
+        try:
+            self.__context.handleEventsTimeout(0)
+        # pylint: disable=undefined-variable
+        except USBErrorInterrupted:
+            # pylint: enable=undefined-variable
+            pass
+        finally:
+            self.refreshTimeout()
+
+    def refreshTimeout(self):
+        """
+        (Re)schedule event handling at next libusb timeout, if any.
+        """
+        timer = self.__timer
+        if timer is not None:
+            timer.cancel()
+            self.__timer = None
+        timeout = self.__context.getNextTimeout()
+        if timeout is not None:
+            loop = self.__loop
+            self.__timer = loop.call_at(
+                loop.time() + timeout, self.__handleEvents,
+            )
+
+    # pylint: disable=unused-argument
+    def _registerFD(self, fd, events, user_data=None):
+        self._unregisterFD(fd)
+        loop = self.__loop
+        if events & _POLLIN:
+            loop.add_reader(fd, self.__handleEvents)
+        if events & _POLLOUT:
+            loop.add_writer(fd, self.__handleEvents)
+        self.__fd_dict[fd] = events
+    # pylint: enable=unused-argument
+
+    # pylint: disable=unused-argument
+    def _unregisterFD(self, fd, user_data=None):
+        events = self.__fd_dict.pop(fd, 0)
+        loop = self.__loop
+        if events & _POLLIN:
+            loop.remove_reader(fd)
+        if events & _POLLOUT:
+            loop.remove_writer(fd)
+    # pylint: enable=unused-argument
+
+class _ChunkedTransfer(object):
+    """
+    State of a buffer transferred in several chunks, each in its own
+    transfer, with several transfers submitted simultaneously.
+    See USBDeviceHandle.bulkWriteChunked and bulkReadChunked.
+
+    Stops at the first short or failed chunk, cancelling later chunks.
+    """
+    def __init__(self, endpoint, data, chunk_list, timeout, completed):
+        """
+        completed (ctypes.c_int)
+            Set to 1 on each transfer completion.
+        """
+        self.__endpoint = endpoint
+        self.__completed = completed
+        self.__data = data
+        self.__chunk_list = chunk_list
+        self.__timeout = timeout
+        self.__next = 0
+        self.__stopped = False
+        # Per chunk: None while pending, actual length once completed.
+        self.__result_list = [None] * len(chunk_list)
+        # (chunk index, exception) tuples.
+        self.__error_list = []
+        self.__transfer_list = []
+
+    def __stop(self):
+        self.__stopped = True
+        for transfer in self.__transfer_list:
+            try:
+                transfer.cancel()
+            # pylint: disable=undefined-variable
+            except (USBErrorNotFound, USBErrorNoDevice):
+                # pylint: enable=undefined-variable
+                pass
+
+    def addTransfer(self, transfer):
+        """
+        Use given transfer, submitting it with next chunk if any.
+        """
+        self.__transfer_list.append(transfer)
+        self.__submitNext(transfer)
+
+    def __submitNext(self, transfer):
+        index = self.__next
+        if self.__stopped or index == len(self.__chunk_list):
+            return
+        self.__next = index + 1
+        offset, size = self.__chunk_list[index]
+        transfer.setBulk(
+            self.__endpoint, self.__data[offset:offset + size],
+            callback=self.__onTransferCompletion, user_data=index,
+            timeout=self.__timeout,
+        )
+        try:
+            transfer.submit()
+        except (USBError, DoomedTransferError):
+            self.__error_list.append((index, sys.exc_info()[1]))
+            self.__stop()
+
+    def __onTransferCompletion(self, transfer):
+        index = transfer.getUserData()
+        status = transfer.getStatus()
+        # pylint: disable=undefined-variable
+        if status == TRANSFER_COMPLETED:
+            # pylint: enable=undefined-variable
+            actual_length = transfer.getActualLength()
+            self.__result_list[index] = actual_length
+            if actual_length < self.__chunk_list[index][1]:
+                self.__stop()
+        # pylint: disable=undefined-variable
+        elif status != TRANSFER_CANCELLED:
+            # pylint: enable=undefined-variable
+            # Data may have been transferred before the error (ex: timeout).
+            self.__result_list[index] = transfer.getActualLength()
+            self.__error_list.append((index, getTransferStatusError(status)))
+            self.__stop()
+        self.__submitNext(transfer)
+        self.__completed.value = 1
+
+    def getResult(self):
+        """
+        Returns the number of contiguous bytes transferred from data start.
+        Raises the error which failed a chunk, unless it happened after a
+        short chunk. The number of contiguous bytes transferred before the
+        error is available as the "transferred" property of the exception.
+        """
+        error_list = self.__error_list
+        failed_set = set(index for index, _ in error_list)
+        transferred = 0
+        for index, ((_, size), actual_length) in enumerate(zip(
+                self.__chunk_list, self.__result_list)):
+            if actual_length is None:
+                break
+            transferred += actual_length
+            if index in failed_set:
+                break
+            if actual_length < size:
+                return transferred
+        if error_list:
+            error = min(error_list, key=lambda x: x[0])[1]
+            error.transferred = transferred
+            raise error
+        return transferred
+
 class _ReleaseInterface(object):
     def __init__(self, handle, interface):
         self._handle = handle
@@ -1156,11 +2872,12 @@ class USBDeviceHandle(object):
     """
     __handle = None
     __libusb_close = libusb1.libusb_close
+    __libusb_dev_mem_free = getattr(libusb1, 'libusb_dev_mem_free', None)
     # pylint: disable=undefined-variable
     __USBErrorNoDevice = USBErrorNoDevice
     __USBErrorNotFound = USBErrorNotFound
-    __USBErrorInterrupted = USBErrorInterrupted
     # pylint: enable=undefined-variable
+    __handleEventsUntil = staticmethod(_handleEventsUntil)
     __set = set
     __KeyError = KeyError
     __sys = sys
@@ -1184,7 +2901,25 @@ class USBDeviceHandle(object):
         # allocated transfer. Storing them as properties solves this. Found
         # with objgraph.
         self.__inflight_add = inflight.add
-        self.__inflight_remove = inflight.remove
+        # Set on each inflight transfer completion, so close does not miss
+        # completions handled by another thread.
+        self.__inflight_completed = inflight_completed = c_int()
+        inflight_remove = inflight.remove
+        def inflightRemove(transfer):
+            inflight_remove(transfer)
+            inflight_completed.value = 1
+        self.__inflight_remove = inflightRemove
+        # Closed transfers kept around for reuse by getTransfer. Disabled
+        # (limit of 0) until setTransferPoolLimit is called.
+        self.__transfer_pool = _TransferPool()
+        # Completion queue set on transfers returned by getTransfer.
+        self.__completion_queue = None
+        # (address, length) of memory allocated by getDeviceMemory.
+        self.__dev_mem_list = []
+        # Per-endpoint (transfer, lock) used by synchronous bulk and
+        # interrupt transfers. None (disabled) until
+        # setPersistentSyncTransfers is called.
+        self.__sync_transfer_dict = None
         self.__handle = handle
         self.__device = device
 
@@ -1198,10 +2933,11 @@ class USBDeviceHandle(object):
 
         This method cancels any in-flight transfer when it is called. As
         cancellation is not immediate, this method needs to let libusb handle
-        events until transfers are actually cancelled.
-        In multi-threaded programs, this can lead to stalls. To avoid this,
-        do not close nor let GC collect a USBDeviceHandle which has in-flight
-        transfers.
+        events until transfers are actually cancelled (possibly by another
+        thread handling events, see USBContext.handleEventsCompleted).
+        With libusb older than 1.0.9, this can lead to stalls in
+        multi-threaded programs. To avoid this, do not close nor let GC
+        collect a USBDeviceHandle which has in-flight transfers.
         """
         handle = self.__handle
         if handle is None:
@@ -1227,13 +2963,20 @@ class USBDeviceHandle(object):
                 transfer.cancel()
             except (self.__USBErrorNotFound, self.__USBErrorNoDevice):
                 pass
-        while inflight:
-            try:
-                self.__context.handleEvents()
-            except self.__USBErrorInterrupted:
-                pass
+        self.__handleEventsUntil(
+            self.__context, lambda: not inflight, self.__inflight_completed,
+        )
+        # All pooled transfers were in self.__transfer_set, so they are doomed
+        # and about to be freed.
+        self.__transfer_pool.clear()
+        if self.__sync_transfer_dict is not None:
+            self.__sync_transfer_dict.clear()
         for transfer in transfer_set:
             transfer.close()
+        dev_mem_list = self.__dev_mem_list
+        while dev_mem_list:
+            address, length = dev_mem_list.pop()
+            self.__libusb_dev_mem_free(handle, address, length)
         self.__libusb_close(handle)
         self.__handle = None
 
@@ -1346,6 +3089,80 @@ class USBDeviceHandle(object):
             self.__handle, bool(enable),
         ))
 
+    def allocStreams(self, num_streams, endpoint_list):
+        """
+        Allocate bulk streams (USB 3.0) on given endpoints.
+        num_streams (int)
+            Number of streams to allocate on each endpoint.
+        endpoint_list (list of int)
+            Endpoints to allocate streams on.
+
+        Returns the number of streams actually allocated, which may be less
+        than requested. Stream ids go from 1 to this number, see
+        USBTransfer.setBulkStream.
+        """
+        endpoint_array, _ = create_initialised_buffer(
+            bytearray(endpoint_list),
+        )
+        return mayRaiseUSBError(libusb1.libusb_alloc_streams(
+            self.__handle, num_streams,
+            cast(endpoint_array, POINTER(c_ubyte)), len(endpoint_list),
+        ))
+
+    def freeStreams(self, endpoint_list):
+        """
+        Free bulk streams allocated by allocStreams on given endpoints.
+        """
+        endpoint_array, _ = create_initialised_buffer(
+            bytearray(endpoint_list),
+        )
+        mayRaiseUSBError(libusb1.libusb_free_streams(
+            self.__handle, cast(endpoint_array, POINTER(c_ubyte)),
+            len(endpoint_list),
+        ))
+
+    def getDeviceMemory(self, length):
+        """
+        Allocate memory suitable for transfers on this device.
+        length (int)
+            Size of the memory, in bytes.
+
+        Returns a writable buffer object. Where libusb and the OS support it,
+        it is kernel memory mapped in this process, so the kernel does not
+        need to copy transfer data between its buffers and python's.
+        Otherwise, it is a regular bytearray.
+
+        This memory (and any view on it, including transfer buffers) must
+        not be used after this handle is closed: it is freed then.
+        See also getBufferArena.
+        """
+        if length <= 0:
+            raise ValueError('Length must be positive')
+        try:
+            dev_mem_alloc = libusb1.libusb_dev_mem_alloc
+        except AttributeError:
+            address = None
+        else:
+            address = dev_mem_alloc(self.__handle, length)
+        if not address:
+            return bytearray(length)
+        self.__dev_mem_list.append((address, length))
+        buffer_ = (c_ubyte * length).from_address(address)
+        if sys.version_info[0] == 3:
+            # So slice assignment accepts bytes.
+            return memoryview(buffer_).cast('B')
+        return buffer_
+
+    def getBufferArena(self, slab_size, slab_count):
+        """
+        Return an USBBufferArena whose slabs are carved from getDeviceMemory.
+        Same lifetime restriction as getDeviceMemory applies.
+        """
+        return USBBufferArena(
+            slab_size, slab_count,
+            self.getDeviceMemory(slab_size * slab_count),
+        )
+
     def getSupportedLanguageList(self):
         """
         Return a list of USB language identifiers (as integers) supported by
@@ -1446,40 +3263,95 @@ class USBDeviceHandle(object):
         Returns the number of bytes actually sent.
         """
         # pylint: disable=undefined-variable
-        request_type = (request_type & ~ENDPOINT_DIR_MASK) | ENDPOINT_OUT
+        request_type = (request_type & ~ENDPOINT_DIR_MASK) | ENDPOINT_OUT
+        # pylint: enable=undefined-variable
+        data, _ = create_initialised_buffer(data)
+        return self._controlTransfer(request_type, request, value, index, data,
+                                     sizeof(data), timeout)
+
+    def controlRead(
+            self, request_type, request, value, index, length, timeout=0):
+        """
+        Synchronous control read.
+        timeout: in milliseconds, how long to wait for data. Set to 0 to
+          disable.
+        See controlWrite for other parameters description.
+
+        To avoid memory copies, use an object implementing the writeable buffer
+        interface (ex: bytearray) for the "data" parameter.
+
+        Returns received data.
+        """
+        # pylint: disable=undefined-variable
+        request_type = (request_type & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
+        # pylint: enable=undefined-variable
+        data, data_buffer = create_binary_buffer(length)
+        transferred = self._controlTransfer(
+            request_type, request, value, index, data, length, timeout,
+        )
+        return data_buffer[:transferred]
+
+    def controlReadStatus(
+            self, request_type, request, value, index, length, timeout=0):
+        """
+        Synchronous control read, reporting errors as a status code instead
+        of raising, for polling loops where errors (ex: timeouts) are
+        expected to be frequent.
+        See controlRead for parameters description.
+
+        Returns a 2-tuple: status (SUCCESS or an ERROR_* constant) and
+        received data (empty on error).
+        """
+        # pylint: disable=undefined-variable
+        request_type = (request_type & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
+        # pylint: enable=undefined-variable
+        data, data_buffer = create_binary_buffer(length)
+        result = libusb1.libusb_control_transfer(
+            self.__handle, request_type, request, value, index, data, length,
+            timeout,
+        )
+        if result < 0:
+            return result, data_buffer[:0]
+        # pylint: disable=undefined-variable
+        return SUCCESS, data_buffer[:result]
         # pylint: enable=undefined-variable
-        data, _ = create_initialised_buffer(data)
-        return self._controlTransfer(request_type, request, value, index, data,
-                                     sizeof(data), timeout)
 
-    def controlRead(
-            self, request_type, request, value, index, length, timeout=0):
+    def controlReadInto(
+            self, request_type, request, value, index, data, timeout=0):
         """
-        Synchronous control read.
-        timeout: in milliseconds, how long to wait for data. Set to 0 to
-          disable.
-        See controlWrite for other parameters description.
-
-        To avoid memory copies, use an object implementing the writeable buffer
-        interface (ex: bytearray) for the "data" parameter.
+        Synchronous control read into given buffer.
+        data: writable buffer (ex: bytearray, memoryview, USBBufferArena
+          slot) to receive data into. Its length is the requested length.
+        See controlRead for other parameters description.
 
-        Returns received data.
+        Returns the number of bytes actually received.
         """
         # pylint: disable=undefined-variable
         request_type = (request_type & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
         # pylint: enable=undefined-variable
-        data, data_buffer = create_binary_buffer(length)
-        transferred = self._controlTransfer(
-            request_type, request, value, index, data, length, timeout,
+        data = create_writable_buffer(data)
+        return self._controlTransfer(
+            request_type, request, value, index, data, sizeof(data), timeout,
         )
-        return data_buffer[:transferred]
 
-    def _bulkTransfer(self, endpoint, data, length, timeout):
+    def _bulkTransferStatus(self, endpoint, data, length, timeout):
+        if self.__sync_transfer_dict is not None:
+            return self.__persistentTransferStatus(
+                'setBulk', endpoint, data, timeout,
+            )
         transferred = c_int()
-        mayRaiseUSBError(libusb1.libusb_bulk_transfer(
+        status = libusb1.libusb_bulk_transfer(
             self.__handle, endpoint, data, length, byref(transferred), timeout,
-        ))
-        return transferred.value
+        )
+        return status, transferred.value
+
+    def _bulkTransfer(self, endpoint, data, length, timeout):
+        status, transferred = self._bulkTransferStatus(
+            endpoint, data, length, timeout,
+        )
+        if status < 0:
+            raiseUSBTransferError(status, transferred)
+        return transferred
 
     def bulkWrite(self, endpoint, data, timeout=0):
         """
@@ -1493,6 +3365,8 @@ class USBDeviceHandle(object):
         interface (ex: bytearray) for the "data" parameter.
 
         Returns the number of bytes actually sent.
+        On error (ex: timeout), the raised USBError's "transferred" property
+        is the number of bytes sent before the error.
         """
         # pylint: disable=undefined-variable
         endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_OUT
@@ -1511,20 +3385,76 @@ class USBDeviceHandle(object):
         interface (ex: bytearray) for the "data" parameter.
 
         Returns received data.
+        On error (ex: timeout), the raised USBError's "received" property is
+        the data received before the error.
         """
         # pylint: disable=undefined-variable
         endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
         # pylint: enable=undefined-variable
         data, data_buffer = create_binary_buffer(length)
-        transferred = self._bulkTransfer(endpoint, data, length, timeout)
+        try:
+            transferred = self._bulkTransfer(endpoint, data, length, timeout)
+        except USBError as exc:
+            # Errors not caused by the transfer itself (ex: failing to
+            # allocate it) carry no "transferred" property.
+            exc.received = data_buffer[:getattr(exc, 'transferred', 0)]
+            raise
         return data_buffer[:transferred]
 
-    def _interruptTransfer(self, endpoint, data, length, timeout):
+    def bulkReadStatus(self, endpoint, length, timeout=0):
+        """
+        Synchronous bulk read, reporting errors as a status code instead of
+        raising, for polling loops where errors (ex: timeouts) are expected
+        to be frequent.
+        See bulkRead for parameters description.
+
+        Returns a 2-tuple: status (SUCCESS or an ERROR_* constant) and
+        received data (possibly partial on error).
+        """
+        # pylint: disable=undefined-variable
+        endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
+        # pylint: enable=undefined-variable
+        data, data_buffer = create_binary_buffer(length)
+        status, transferred = self._bulkTransferStatus(
+            endpoint, data, length, timeout,
+        )
+        return status, data_buffer[:transferred]
+
+    def bulkReadInto(self, endpoint, data, timeout=0):
+        """
+        Synchronous bulk read into given buffer.
+        data: writable buffer (ex: bytearray, memoryview, USBBufferArena
+          slot) to receive data into. Its length is the requested length.
+        See bulkRead for other parameters description.
+
+        Returns the number of bytes actually received.
+        On error (ex: timeout), the raised USBError's "transferred" property
+        is the number of bytes received before the error.
+        """
+        # pylint: disable=undefined-variable
+        endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
+        # pylint: enable=undefined-variable
+        data = create_writable_buffer(data)
+        return self._bulkTransfer(endpoint, data, sizeof(data), timeout)
+
+    def _interruptTransferStatus(self, endpoint, data, length, timeout):
+        if self.__sync_transfer_dict is not None:
+            return self.__persistentTransferStatus(
+                'setInterrupt', endpoint, data, timeout,
+            )
         transferred = c_int()
-        mayRaiseUSBError(libusb1.libusb_interrupt_transfer(
+        status = libusb1.libusb_interrupt_transfer(
             self.__handle, endpoint, data, length, byref(transferred), timeout,
-        ))
-        return transferred.value
+        )
+        return status, transferred.value
+
+    def _interruptTransfer(self, endpoint, data, length, timeout):
+        status, transferred = self._interruptTransferStatus(
+            endpoint, data, length, timeout,
+        )
+        if status < 0:
+            raiseUSBTransferError(status, transferred)
+        return transferred
 
     def interruptWrite(self, endpoint, data, timeout=0):
         """
@@ -1538,6 +3468,8 @@ class USBDeviceHandle(object):
         interface (ex: bytearray) for the "data" parameter.
 
         Returns the number of bytes actually sent.
+        On error (ex: timeout), the raised USBError's "transferred" property
+        is the number of bytes sent before the error.
         """
         # pylint: disable=undefined-variable
         endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_OUT
@@ -1556,27 +3488,680 @@ class USBDeviceHandle(object):
         interface (ex: bytearray) for the "data" parameter.
 
         Returns received data.
+        On error (ex: timeout), the raised USBError's "received" property is
+        the data received before the error.
         """
         # pylint: disable=undefined-variable
         endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
         # pylint: enable=undefined-variable
         data, data_buffer = create_binary_buffer(length)
-        transferred = self._interruptTransfer(endpoint, data, length, timeout)
+        try:
+            transferred = self._interruptTransfer(
+                endpoint, data, length, timeout,
+            )
+        except USBError as exc:
+            # Errors not caused by the transfer itself (ex: failing to
+            # allocate it) carry no "transferred" property.
+            exc.received = data_buffer[:getattr(exc, 'transferred', 0)]
+            raise
         return data_buffer[:transferred]
 
+    def interruptReadStatus(self, endpoint, length, timeout=0):
+        """
+        Synchronous interrupt read, reporting errors as a status code instead
+        of raising, for polling loops where errors (ex: timeouts) are
+        expected to be frequent.
+        See interruptRead for parameters description.
+
+        Returns a 2-tuple: status (SUCCESS or an ERROR_* constant) and
+        received data (possibly partial on error).
+        """
+        # pylint: disable=undefined-variable
+        endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
+        # pylint: enable=undefined-variable
+        data, data_buffer = create_binary_buffer(length)
+        status, transferred = self._interruptTransferStatus(
+            endpoint, data, length, timeout,
+        )
+        return status, data_buffer[:transferred]
+
+    def interruptReadInto(self, endpoint, data, timeout=0):
+        """
+        Synchronous interrupt read into given buffer.
+        data: writable buffer (ex: bytearray, memoryview, USBBufferArena
+          slot) to receive data into. Its length is the requested length.
+        See interruptRead for other parameters description.
+
+        Returns the number of bytes actually received.
+        On error (ex: timeout), the raised USBError's "transferred" property
+        is the number of bytes received before the error.
+        """
+        # pylint: disable=undefined-variable
+        endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
+        # pylint: enable=undefined-variable
+        data = create_writable_buffer(data)
+        return self._interruptTransfer(endpoint, data, sizeof(data), timeout)
+
+    def _bulkTransferChunked(
+            self, endpoint, data, chunk_size, depth, timeout, max_packet_size,
+            zero_packet=False):
+        """
+        Transfer data (a writable memoryview) in chunks of at most chunk_size
+        bytes, keeping up to depth chunks submitted.
+        See _ChunkedTransfer.
+        """
+        if depth < 1:
+            raise ValueError('depth must be positive')
+        if max_packet_size is None:
+            max_packet_size = self.__device.getMaxPacketSize(endpoint)
+        # Only the last chunk may end with a short packet.
+        chunk_size -= chunk_size % max_packet_size
+        if chunk_size <= 0:
+            chunk_size = max_packet_size
+        length = len(data)
+        chunk_list = [
+            (offset, min(chunk_size, length - offset))
+            for offset in xrange(0, length, chunk_size)
+        ]
+        if not chunk_list or (
+                zero_packet and length % max_packet_size == 0):
+            # Zero-length packet, to tell device transfer is over.
+            chunk_list.append((length, 0))
+        completed = c_int()
+        chunked = _ChunkedTransfer(
+            endpoint, data, chunk_list, timeout, completed,
+        )
+        transfer_list = []
+        try:
+            for _ in xrange(min(depth, len(chunk_list))):
+                transfer = self.getTransfer()
+                transfer.setCompletionQueue(None)
+                transfer_list.append(transfer)
+                chunked.addTransfer(transfer)
+            self._waitTransfers(transfer_list, completed)
+        finally:
+            for transfer in transfer_list:
+                if transfer.isSubmitted():
+                    # Not closing it, so it gets freed once complete.
+                    transfer.doom()
+                else:
+                    transfer.close()
+        return chunked.getResult()
+
+    def _waitTransfers(self, transfer_list, completed):
+        """
+        Handle events until none of given transfers is submitted.
+        completed (ctypes.c_int)
+            Set to a non-zero value by given transfers' callbacks.
+        """
+        def isDone():
+            for transfer in transfer_list:
+                if transfer.isSubmitted():
+                    return False
+            return True
+        _handleEventsUntil(self.__context, isDone, completed)
+
+    def bulkWriteChunked(
+            self, endpoint, data, chunk_size=65536, depth=4, timeout=0,
+            zero_packet=False, max_packet_size=None):
+        """
+        Synchronous bulk write, split in several transfers submitted
+        concurrently. Useful to send large amounts of data at full speed.
+        endpoint: endpoint to send data to.
+        data: data to send.
+        chunk_size: maximum size of each transfer, in bytes. Rounded down to
+          a multiple of max_packet_size.
+        depth: maximum number of transfers submitted simultaneously.
+        timeout: in milliseconds, how long to wait for device acknowledgement
+          of each transfer. Set to 0 to disable.
+        zero_packet: if true and data length is a multiple of
+          max_packet_size, send a zero-length packet after data, to tell
+          device the transfer is over.
+        max_packet_size: endpoint's maximum packet size. If None, use
+          USBDevice.getMaxPacketSize (see its warning).
+
+        To avoid memory copies, use an object implementing the writeable buffer
+        interface (ex: bytearray) for the "data" parameter.
+
+        Returns the number of bytes actually sent, which stops at the first
+        transfer device did not completely accept.
+        On error (ex: timeout), the raised USBError's "transferred" property
+        is the number of bytes sent before the error.
+        """
+        # pylint: disable=undefined-variable
+        endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_OUT
+        # pylint: enable=undefined-variable
+        _, data = create_initialised_buffer(data)
+        return self._bulkTransferChunked(
+            endpoint, memoryview(data), chunk_size, depth, timeout,
+            max_packet_size, zero_packet,
+        )
+
+    def bulkReadChunked(
+            self, endpoint, length, chunk_size=65536, depth=4, timeout=0,
+            max_packet_size=None):
+        """
+        Synchronous bulk read, split in several transfers submitted
+        concurrently. Useful to receive large amounts of data at full speed.
+        Each transfer receives data directly in its place in returned buffer.
+        See bulkWriteChunked for parameters description.
+
+        Reception stops at the first short packet (which includes zero-length
+        packets): transfers after it are cancelled. Any data they may have
+        already received is discarded, so device should not send more data
+        than requested after a short packet.
+
+        Returns received data.
+        On error (ex: timeout), the raised USBError's "received" property is
+        the data received before the error.
+        """
+        # pylint: disable=undefined-variable
+        endpoint = (endpoint & ~ENDPOINT_DIR_MASK) | ENDPOINT_IN
+        # pylint: enable=undefined-variable
+        data = bytearray(length)
+        if not length:
+            return data
+        try:
+            transferred = self._bulkTransferChunked(
+                endpoint, memoryview(data), chunk_size, depth, timeout,
+                max_packet_size,
+            )
+        except USBError as exc:
+            # Errors not caused by a chunk (ex: while getting max packet
+            # size) happen before any transfer.
+            exc.received = data[:getattr(exc, 'transferred', 0)]
+            raise
+        if transferred < length:
+            data = data[:transferred]
+        return data
+
     def getTransfer(self, iso_packets=0):
         """
         Get an USBTransfer instance for asynchronous use.
         iso_packets: the number of isochronous transfer descriptors to
           allocate.
-        """
+
+        If the transfer pool is enabled (see setTransferPoolLimit), an idle
+        transfer is reused when available. In any case, returned transfer
+        must be configured (setControl, setBulk, ...) before being submitted.
+        """
+        pool = self.__transfer_pool
+        if pool.limit:
+            result = pool.get(iso_packets)
+            if result is not None:
+                result.setCompletionQueue(self.__completion_queue)
+                return result
+            recycle = pool.put
+        else:
+            recycle = None
         result = USBTransfer(
             self.__handle, iso_packets,
             self.__inflight_add, self.__inflight_remove,
+            recycle,
         )
+        result.setCompletionQueue(self.__completion_queue)
         self.__transfer_set.add(result)
         return result
 
+    def getBulkReader(
+            self, endpoint, length, depth=4, timeout=0, callback=None):
+        """
+        Get an USBBulkReader instance, to continuously receive data from a
+        bulk endpoint.
+        endpoint: endpoint to receive data from.
+        length: size of each transfer, in bytes. Should be a multiple of
+          endpoint's maximum packet size.
+        depth: number of transfers to keep submitted.
+        timeout: in milliseconds, how long each transfer waits for data. Set
+          to 0 to disable.
+        callback: if provided, called with each received data chunk instead of
+          queuing them for USBBulkReader.read.
+
+        Call start() on returned instance to begin receiving.
+        """
+        return USBBulkReader(
+            self, self.__context, endpoint, length, depth, timeout, callback,
+        )
+
+    def getIsochronousReader(
+            self, endpoint, packet_size, packet_count, depth=4, timeout=0,
+            callback=None):
+        """
+        Get an USBIsochronousReader instance, to continuously receive data
+        from an isochronous endpoint.
+        endpoint: endpoint to receive data from.
+        packet_size: size of each isochronous packet, in bytes. Should be
+          endpoint's maximum packet size (see
+          USBDevice.getMaxISOPacketSize).
+        packet_count: number of isochronous packets per transfer.
+        depth: number of transfers to keep submitted.
+        timeout: in milliseconds, how long each transfer waits for data. Set
+          to 0 to disable.
+        callback: if provided, called with each received packet's data
+          instead of queuing them for USBIsochronousReader.read.
+
+        Call start() on returned instance to begin receiving.
+        """
+        return USBIsochronousReader(
+            self, self.__context, endpoint, packet_size, packet_count, depth,
+            timeout, callback,
+        )
+
+    def getIsochronousWriter(
+            self, endpoint, packet_size, packet_count, depth=4, timeout=0,
+            producer=None):
+        """
+        Get an USBIsochronousWriter instance, to continuously send data to an
+        isochronous endpoint.
+        endpoint: endpoint to send data to.
+        packet_size, packet_count, depth, timeout: see getIsochronousReader.
+        producer: if provided, called with each transfer buffer to fill,
+          instead of sending data given to USBIsochronousWriter.write.
+
+        Call start() on returned instance to begin sending.
+        """
+        return USBIsochronousWriter(
+            self, self.__context, endpoint, packet_size, packet_count, depth,
+            timeout, producer,
+        )
+
+    def getBulkWriter(self, endpoint, length, depth=4, timeout=0):
+        """
+        Get an USBBulkWriter instance, to stream data to a bulk endpoint.
+        endpoint: endpoint to send data to.
+        length: maximum size of each transfer, in bytes. Should be a multiple
+          of endpoint's maximum packet size.
+        depth: maximum number of transfers submitted simultaneously.
+        timeout: in milliseconds, how long to wait for device acknowledgement
+          of each transfer. Set to 0 to disable.
+        """
+        return USBBulkWriter(
+            self, self.__context, endpoint, length, depth, timeout,
+        )
+
+    def setCompletionQueue(self, queue):
+        """
+        Set the completion queue of transfers subsequently returned by
+        getTransfer.
+        queue: an USBCompletionQueue instance, possibly shared with other
+          device handles, or None to have completion callbacks called.
+
+        Transfers already obtained are not modified, see
+        USBTransfer.setCompletionQueue .
+        """
+        self.__completion_queue = queue
+
+    def getCompletionQueue(self):
+        """
+        Get completion queue set by setCompletionQueue.
+        """
+        return self.__completion_queue
+
+    def drainCompletions(self, max_n=None):
+        """
+        Remove and return a list of completed transfers from this device
+        handle's completion queue.
+        See USBCompletionQueue.drain .
+        """
+        queue = self.__completion_queue
+        if queue is None:
+            raise ValueError('No completion queue set')
+        return queue.drain(max_n)
+
+    def setTransferPoolLimit(self, limit):
+        """
+        Set the maximum number of idle transfers kept for reuse, per number
+        of isochronous packets.
+
+        When non-zero, closing a (non-doomed) transfer obtained from
+        getTransfer resets it and keeps it in a pool instead of freeing it,
+        and getTransfer takes transfers from this pool before allocating new
+        ones. This saves a libusb_transfer allocation and the corresponding
+        python objects per transfer.
+        Setting 0 (the default) disables the pool and frees idle transfers.
+        Transfers obtained while the pool was disabled are never pooled.
+        """
+        if limit < 0:
+            raise ValueError('Pool limit cannot be negative')
+        pool = self.__transfer_pool
+        pool.limit = limit
+        pool.trim()
+
+    def getTransferPoolStats(self):
+        """
+        Returns a dict describing transfer pool activity:
+        - hit: number of getTransfer calls served from the pool
+        - miss: number of getTransfer calls which had to allocate while the
+          pool was enabled
+        - discard: number of transfers freed on close because the pool was
+          full
+        - idle: number of transfers currently in the pool
+        """
+        pool = self.__transfer_pool
+        return {
+            'hit': pool.hit_count,
+            'miss': pool.miss_count,
+            'discard': pool.discard_count,
+            'idle': len(pool),
+        }
+
+    def setPersistentSyncTransfers(self, enable):
+        """
+        Control how synchronous bulk and interrupt transfers are done.
+        enable (bool)
+            False (the default): use libusb's synchronous API, which
+            allocates and frees a transfer on each call.
+            True: keep one transfer per endpoint, submitted and waited for
+            on each call. Concurrent calls on the same endpoint are
+            serialised.
+
+        Either way, events may be handled by another thread while a
+        synchronous call is waiting.
+        """
+        sync_transfer_dict = self.__sync_transfer_dict
+        if enable:
+            if sync_transfer_dict is None:
+                self.__sync_transfer_dict = {}
+        elif sync_transfer_dict is not None:
+            self.__sync_transfer_dict = None
+            for transfer, lock, _, _ in sync_transfer_dict.values():
+                with lock:
+                    transfer.close()
+
+    def __persistentTransferStatus(self, setter_id, endpoint, data, timeout):
+        """
+        Synchronous transfer using the persistent transfer of given
+        endpoint.
+        Returns a 2-tuple: status (SUCCESS or an ERROR_* constant) and the
+        number of bytes transferred, like libusb synchronous functions.
+        """
+        sync_transfer_dict = self.__sync_transfer_dict
+        try:
+            transfer, lock, completed, callback = sync_transfer_dict[endpoint]
+        except KeyError:
+            transfer = self.getTransfer()
+            transfer.setCompletionQueue(None)
+            completed = c_int()
+            transfer, lock, completed, callback = \
+                sync_transfer_dict.setdefault(endpoint, (
+                    transfer, threading.Lock(), completed,
+                    functools.partial(_setCompleted, completed),
+                ))
+        with lock:
+            getattr(transfer, setter_id)(
+                endpoint, data, callback=callback, timeout=timeout,
+            )
+            try:
+                transfer.submit()
+            except USBError as exc:
+                transfer.setBuffer(0)
+                return exc.value, 0
+            try:
+                self._waitTransfers((transfer, ), completed)
+            except:
+                exc = sys.exc_info()[1]
+                # Do not let libusb access caller's buffer after returning.
+                try:
+                    transfer.cancel()
+                except USBError:
+                    pass
+                self._waitTransfers((transfer, ), completed)
+                if isinstance(exc, USBError):
+                    exc.transferred = transfer.getActualLength()
+                transfer.setBuffer(0)
+                raise
+            status = transfer.getStatus()
+            transferred = transfer.getActualLength()
+            # Release caller's buffer.
+            transfer.setBuffer(0)
+        # pylint: disable=undefined-variable
+        if status == TRANSFER_COMPLETED:
+            return SUCCESS, transferred
+        # pylint: enable=undefined-variable
+        return TRANSFER_STATUS_TO_ERROR_DICT.get(status, status), transferred
+
+    def _submitTransfer(self, configure, get_result, resolve, lock):
+        """
+        Get a transfer, set it up and submit it.
+        configure: callable receiving the transfer and its completion
+          callback, expected to call one of the transfer setters.
+        get_result: callable receiving the completed transfer and returning
+          the value to resolve with.
+        resolve: callable receiving (error, result) once transfer completed,
+          error being None on success, result being None on failure.
+          Called from the thread handling libusb events.
+        lock: held while resolving and closing transfer. Hold it while
+          using the returned transfer from another thread, so it is not
+          closed (and possibly reused from the pool) meanwhile.
+
+        Transfer is closed after resolve returns, so it goes back to the
+        transfer pool if enabled.
+        Returns the submitted transfer.
+        """
+        def onCompletion(transfer):
+            with lock:
+                try:
+                    status = transfer.getStatus()
+                    # pylint: disable=undefined-variable
+                    if status == TRANSFER_COMPLETED:
+                        # pylint: enable=undefined-variable
+                        resolve(None, get_result(transfer))
+                    else:
+                        resolve(getTransferStatusError(status), None)
+                finally:
+                    transfer.close()
+        transfer = self.getTransfer()
+        transfer.setCompletionQueue(None)
+        configure(transfer, onCompletion)
+        try:
+            transfer.submit()
+        except:
+            transfer.close()
+            raise
+        return transfer
+
+    def __submitFuture(self, future, resolve, configure, get_result):
+        completed = []
+        # Reentrant, as resolving a future may run its done callbacks.
+        lock = threading.RLock()
+        def onCompletion(error, result):
+            completed.append(None)
+            resolve(future, error, result)
+        transfer = self._submitTransfer(
+            configure, get_result, onCompletion, lock,
+        )
+        def onDone(future):
+            with lock:
+                # Once completed, transfer is closed and may be in use by
+                # someone else.
+                if future.cancelled() and not completed:
+                    try:
+                        transfer.cancel()
+                    # pylint: disable=undefined-variable
+                    except (USBErrorNotFound, USBErrorNoDevice):
+                        # pylint: enable=undefined-variable
+                        pass
+        future.add_done_callback(onDone)
+        return future
+
+    def __submitAsyncio(self, loop, configure, get_result):
+        if asyncio is None:
+            raise NotImplementedError('asyncio is not available')
+        if loop is None:
+            loop = _getDefaultLoop()
+        def resolve(future, error, result):
+            if _getRunningLoop() is loop:
+                _resolveFuture(future, error, result)
+            else:
+                loop.call_soon_threadsafe(
+                    _resolveFuture, future, error, result,
+                )
+        return self.__submitFuture(
+            asyncio.Future(loop=loop), resolve, configure, get_result,
+        )
+
+    def __submitConcurrent(self, configure, get_result):
+        if _ConcurrentFuture is None:
+            raise NotImplementedError('concurrent.futures is not available')
+        return self.__submitFuture(
+            _ConcurrentFuture(), _resolveConcurrentFuture, configure,
+            get_result,
+        )
+
+    def controlWriteAsync(
+            self, request_type, request, value, index, data, timeout=0,
+            loop=None):
+        """
+        Asynchronous control write, for asyncio.
+        loop: event loop the returned future belongs to. Defaults to the
+          event loop running in current thread. Required when no event loop
+          is running.
+        See controlWrite for other parameters description.
+
+        Returns an asyncio.Future resolved with the number of bytes actually
+        sent, or failed with an USBError subclass instance.
+        Cancelling the future cancels the transfer.
+        Libusb events must be handled for the future to ever be resolved, see
+        USBAsyncioPoller.
+        """
+        return self.__submitAsyncio(loop, *_controlWriteSetup(
+            request_type, request, value, index, data, timeout,
+        ))
+
+    def controlReadAsync(
+            self, request_type, request, value, index, length, timeout=0,
+            loop=None):
+        """
+        Asynchronous control read, for asyncio.
+        See controlRead and controlWriteAsync.
+
+        Returns an asyncio.Future resolved with received data.
+        """
+        return self.__submitAsyncio(loop, *_controlReadSetup(
+            request_type, request, value, index, length, timeout,
+        ))
+
+    def bulkWriteAsync(self, endpoint, data, timeout=0, loop=None):
+        """
+        Asynchronous bulk write, for asyncio.
+        See bulkWrite and controlWriteAsync.
+
+        Returns an asyncio.Future resolved with the number of bytes actually
+        sent.
+        """
+        return self.__submitAsyncio(loop, *_bulkWriteSetup(
+            endpoint, data, timeout,
+        ))
+
+    def bulkReadAsync(self, endpoint, length, timeout=0, loop=None):
+        """
+        Asynchronous bulk read, for asyncio.
+        See bulkRead and controlWriteAsync.
+
+        Returns an asyncio.Future resolved with received data.
+        """
+        return self.__submitAsyncio(loop, *_bulkReadSetup(
+            endpoint, length, timeout,
+        ))
+
+    def interruptWriteAsync(self, endpoint, data, timeout=0, loop=None):
+        """
+        Asynchronous interrupt write, for asyncio.
+        See interruptWrite and controlWriteAsync.
+
+        Returns an asyncio.Future resolved with the number of bytes actually
+        sent.
+        """
+        return self.__submitAsyncio(loop, *_interruptWriteSetup(
+            endpoint, data, timeout,
+        ))
+
+    def interruptReadAsync(self, endpoint, length, timeout=0, loop=None):
+        """
+        Asynchronous interrupt read, for asyncio.
+        See interruptRead and controlWriteAsync.
+
+        Returns an asyncio.Future resolved with received data.
+        """
+        return self.__submitAsyncio(loop, *_interruptReadSetup(
+            endpoint, length, timeout,
+        ))
+
+    def controlWriteFuture(
+            self, request_type, request, value, index, data, timeout=0):
+        """
+        Asynchronous control write, for threaded applications.
+        See controlWrite for parameters description.
+
+        Returns a concurrent.futures.Future resolved with the number of bytes
+        actually sent, or failed with an USBError subclass instance, from the
+        thread handling libusb events (ex: an USBPollerThread). So many
+        transfers can be waited upon with concurrent.futures.wait or
+        concurrent.futures.as_completed.
+        Cancelling the future cancels the transfer.
+        """
+        return self.__submitConcurrent(*_controlWriteSetup(
+            request_type, request, value, index, data, timeout,
+        ))
+
+    def controlReadFuture(
+            self, request_type, request, value, index, length, timeout=0):
+        """
+        Asynchronous control read, for threaded applications.
+        See controlRead and controlWriteFuture.
+
+        Returns a concurrent.futures.Future resolved with received data.
+        """
+        return self.__submitConcurrent(*_controlReadSetup(
+            request_type, request, value, index, length, timeout,
+        ))
+
+    def bulkWriteFuture(self, endpoint, data, timeout=0):
+        """
+        Asynchronous bulk write, for threaded applications.
+        See bulkWrite and controlWriteFuture.
+
+        Returns a concurrent.futures.Future resolved with the number of bytes
+        actually sent.
+        """
+        return self.__submitConcurrent(*_bulkWriteSetup(
+            endpoint, data, timeout,
+        ))
+
+    def bulkReadFuture(self, endpoint, length, timeout=0):
+        """
+        Asynchronous bulk read, for threaded applications.
+        See bulkRead and controlWriteFuture.
+
+        Returns a concurrent.futures.Future resolved with received data.
+        """
+        return self.__submitConcurrent(*_bulkReadSetup(
+            endpoint, length, timeout,
+        ))
+
+    def interruptWriteFuture(self, endpoint, data, timeout=0):
+        """
+        Asynchronous interrupt write, for threaded applications.
+        See interruptWrite and controlWriteFuture.
+
+        Returns a concurrent.futures.Future resolved with the number of bytes
+        actually sent.
+        """
+        return self.__submitConcurrent(*_interruptWriteSetup(
+            endpoint, data, timeout,
+        ))
+
+    def interruptReadFuture(self, endpoint, length, timeout=0):
+        """
+        Asynchronous interrupt read, for threaded applications.
+        See interruptRead and controlWriteFuture.
+
+        Returns a concurrent.futures.Future resolved with received data.
+        """
+        return self.__submitConcurrent(*_interruptReadSetup(
+            endpoint, length, timeout,
+        ))
+
 class USBConfiguration(object):
     def __init__(self, context, config):
         """
@@ -2081,6 +4666,9 @@ class USBContext(object):
     Also provides access to global (device-independent) libusb1 functions.
     """
     __libusb_exit = libusb1.libusb_exit
+    __libusb_interrupt_event_handler = getattr(
+        libusb1, 'libusb_interrupt_event_handler', None,
+    )
     __context_p = None
     __added_cb = None
     __removed_cb = None
@@ -2186,6 +4774,10 @@ class USBContext(object):
         self.__context_cond.acquire()
         try:
             while self.__context_refcount and self.__context_p:
+                # Threads handling events would otherwise only notice
+                # after an event or timeout.
+                if self.__libusb_interrupt_event_handler is not None:
+                    self.__libusb_interrupt_event_handler(self.__context_p)
                 self.__context_cond.wait()
             self._exit()
         finally:
@@ -2339,7 +4931,29 @@ class USBContext(object):
             libusb1.libusb_handle_events(self.__context_p),
         )
 
-    # TODO: handleEventsCompleted
+    @_validContext
+    def handleEventsCompleted(self, completed):
+        """
+        Handle any pending event (blocking), unless completed is true.
+        completed (ctypes.c_int)
+            Flag to set to a non-zero value (ex: from a transfer callback)
+            when the awaited event happened. As libusb checks it with its
+            locks held, this does not miss a completion handled by another
+            thread, which would otherwise block until libusb's timeout.
+        Falls back to handleEvents when libusb does not provide
+        libusb_handle_events_completed.
+        """
+        try:
+            handle_events_completed = libusb1.libusb_handle_events_completed
+        except AttributeError:
+            if not completed.value:
+                mayRaiseUSBError(
+                    libusb1.libusb_handle_events(self.__context_p),
+                )
+        else:
+            mayRaiseUSBError(
+                handle_events_completed(self.__context_p, byref(completed)),
+            )
 
     @_validContext
     def handleEventsTimeout(self, tv=0):
@@ -2360,7 +4974,45 @@ class USBContext(object):
             ),
         )
 
-    # TODO: handleEventsTimeoutCompleted
+    @_validContext
+    def handleEventsTimeoutCompleted(self, tv, completed):
+        """
+        Handle any pending event, unless completed is true.
+        tv: see handleEventsTimeout.
+        completed: see handleEventsCompleted.
+        Falls back to handleEventsTimeout when libusb does not provide
+        libusb_handle_events_timeout_completed.
+        """
+        if tv is None:
+            tv = 0
+        tv_s = int(tv)
+        real_tv = libusb1.timeval(tv_s, int((tv - tv_s) * 1000000))
+        try:
+            handle_events_timeout_completed = \
+                libusb1.libusb_handle_events_timeout_completed
+        except AttributeError:
+            if not completed.value:
+                mayRaiseUSBError(
+                    libusb1.libusb_handle_events_timeout(
+                        self.__context_p, byref(real_tv),
+                    ),
+                )
+        else:
+            mayRaiseUSBError(
+                handle_events_timeout_completed(
+                    self.__context_p, byref(real_tv), byref(completed),
+                ),
+            )
+
+    @_validContext
+    def interruptEventHandler(self):
+        """
+        Make the thread currently handling events on this context return
+        without waiting for an event nor a timeout. If no thread is handling
+        events, the next one to do so returns immediately.
+        Requires libusb 1.0.21 or later.
+        """
+        libusb1.libusb_interrupt_event_handler(self.__context_p)
 
     @_validContext
     def setPollFDNotifiers(
@@ -2371,12 +5023,14 @@ class USBContext(object):
         You should not have to call this method, unless you are integrating
         this class with a polling mechanism.
         """
+        # Note: calling a ctypes function pointer type without argument
+        # produces a NULL function pointer.
         if added_cb is None:
-            added_cb = self.__null_pointer
+            added_cb = libusb1.libusb_pollfd_added_cb_p()
         else:
             added_cb = libusb1.libusb_pollfd_added_cb_p(added_cb)
         if removed_cb is None:
-            removed_cb = self.__null_pointer
+            removed_cb = libusb1.libusb_pollfd_removed_cb_p()
         else:
             removed_cb = libusb1.libusb_pollfd_removed_cb_p(removed_cb)
         if user_data is None:
@@ -80,7 +80,9 @@ class Enum(object):
 
 def buffer_at(address, length):
     """
-    Simular to ctypes.string_at, but zero-copy and requires an integer address.
+    Simular to ctypes.string_at, but returns a bytearray and requires an
+    integer address.
+    Note: returned bytearray is a copy of given memory.
     """
     return bytearray((c_char * length).from_address(address))
 
@@ -314,6 +316,8 @@ libusb_transfer_type = Enum({
     'LIBUSB_TRANSFER_TYPE_BULK': 2,
     # Interrupt endpoint
     'LIBUSB_TRANSFER_TYPE_INTERRUPT': 3,
+    # Stream endpoint
+    'LIBUSB_TRANSFER_TYPE_BULK_STREAM': 4,
 })
 
 # Standard requests, as defined in table 9-3 of the USB2 specifications
@@ -949,6 +953,44 @@ else:
     libusb_set_auto_detach_kernel_driver.argtypes = [
         libusb_device_handle_p, c_int]
     libusb_set_auto_detach_kernel_driver.restype = c_int
+try:
+    #int libusb_alloc_streams(libusb_device_handle *dev, uint32_t num_streams,
+    #       unsigned char *endpoints, int num_endpoints);
+    libusb_alloc_streams = libusb.libusb_alloc_streams
+except AttributeError:
+    pass
+else:
+    libusb_alloc_streams.argtypes = [
+        libusb_device_handle_p, c_uint32, POINTER(c_uchar), c_int]
+    libusb_alloc_streams.restype = c_int
+try:
+    #int libusb_free_streams(libusb_device_handle *dev,
+    #       unsigned char *endpoints, int num_endpoints);
+    libusb_free_streams = libusb.libusb_free_streams
+except AttributeError:
+    pass
+else:
+    libusb_free_streams.argtypes = [
+        libusb_device_handle_p, POINTER(c_uchar), c_int]
+    libusb_free_streams.restype = c_int
+try:
+    #unsigned char *libusb_dev_mem_alloc(libusb_device_handle *dev,
+    #       size_t length);
+    libusb_dev_mem_alloc = libusb.libusb_dev_mem_alloc
+except AttributeError:
+    pass
+else:
+    libusb_dev_mem_alloc.argtypes = [libusb_device_handle_p, c_size_t]
+    libusb_dev_mem_alloc.restype = c_void_p
+try:
+    #int libusb_dev_mem_free(libusb_device_handle *dev, unsigned char *buffer,
+    #       size_t length);
+    libusb_dev_mem_free = libusb.libusb_dev_mem_free
+except AttributeError:
+    pass
+else:
+    libusb_dev_mem_free.argtypes = [libusb_device_handle_p, c_void_p, c_size_t]
+    libusb_dev_mem_free.restype = c_int
 
 # Get the data section of a control transfer. This convenience function is here
 # to remind you that the data does not start until 8 bytes into the actual
@@ -963,8 +1005,10 @@ else:
 
 def libusb_control_transfer_get_data(transfer_p):
     transfer = transfer_p.contents
-    return buffer_at(transfer.buffer.value, transfer.length)[
-        LIBUSB_CONTROL_SETUP_SIZE:]
+    return buffer_at(
+        transfer.buffer + LIBUSB_CONTROL_SETUP_SIZE,
+        transfer.length - LIBUSB_CONTROL_SETUP_SIZE,
+    )
 
 def libusb_control_transfer_get_setup(transfer_p):
     return cast(transfer_p.contents.buffer, libusb_control_setup_p)
@@ -992,6 +1036,23 @@ libusb_cancel_transfer.argtypes = [libusb_transfer_p]
 libusb_free_transfer = libusb.libusb_free_transfer
 libusb_free_transfer.argtypes = [libusb_transfer_p]
 libusb_free_transfer.restype = None
+try:
+    #void libusb_transfer_set_stream_id(struct libusb_transfer *transfer,
+    #       uint32_t stream_id);
+    libusb_transfer_set_stream_id = libusb.libusb_transfer_set_stream_id
+except AttributeError:
+    pass
+else:
+    libusb_transfer_set_stream_id.argtypes = [libusb_transfer_p, c_uint32]
+    libusb_transfer_set_stream_id.restype = None
+try:
+    #uint32_t libusb_transfer_get_stream_id(struct libusb_transfer *transfer);
+    libusb_transfer_get_stream_id = libusb.libusb_transfer_get_stream_id
+except AttributeError:
+    pass
+else:
+    libusb_transfer_get_stream_id.argtypes = [libusb_transfer_p]
+    libusb_transfer_get_stream_id.restype = c_uint32
 
 # pylint: disable=redefined-builtin
 def libusb_fill_control_transfer(
@@ -1031,6 +1092,28 @@ def libusb_fill_bulk_transfer(
     transfer.callback = callback
 # pylint: enable=redefined-builtin
 
+# pylint: disable=redefined-builtin
+def libusb_fill_bulk_stream_transfer(
+        transfer_p, dev_handle, endpoint, stream_id, buffer, length,
+        callback, user_data, timeout):
+    # Optional, so check before altering transfer.
+    try:
+        transfer_set_stream_id = globals()['libusb_transfer_set_stream_id']
+    except KeyError:
+        raise AttributeError(
+            'libusb_transfer_set_stream_id not available: libusb does not '
+            'support bulk streams',
+        )
+    libusb_fill_bulk_transfer(
+        transfer_p, dev_handle, endpoint, buffer, length, callback,
+        user_data, timeout,
+    )
+    # pylint: disable=undefined-variable
+    transfer_p.contents.type = LIBUSB_TRANSFER_TYPE_BULK_STREAM
+    # pylint: enable=undefined-variable
+    transfer_set_stream_id(transfer_p, stream_id)
+# pylint: enable=redefined-builtin
+
 # pylint: disable=redefined-builtin
 def libusb_fill_interrupt_transfer(
         transfer_p, dev_handle, endpoint, buffer,
@@ -1241,6 +1324,15 @@ except AttributeError:
     pass
 else:
     libusb_handle_events_completed.argtypes = [libusb_context_p, c_int_p]
+#void libusb_interrupt_event_handler(libusb_context *ctx);
+try:
+    libusb_interrupt_event_handler = libusb.libusb_interrupt_event_handler
+except AttributeError:
+    # Requires libusb 1.0.21 .
+    pass
+else:
+    libusb_interrupt_event_handler.argtypes = [libusb_context_p]
+    libusb_interrupt_event_handler.restype = None
 #int libusb_handle_events_locked(libusb_context *ctx, struct timeval *tv);
 libusb_handle_events_locked = libusb.libusb_handle_events_locked
 libusb_handle_events_locked.argtypes = [libusb_context_p, timeval_p]
@@ -15,13 +15,25 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301  USA
 
 # pylint: disable=invalid-name, missing-docstring, too-many-public-methods
+import array
 import unittest
 import sys
 import itertools
 import select
 import threading
+import time
+import weakref
+try:
+    import asyncio
+except ImportError:
+    asyncio = None
+try:
+    from concurrent import futures as concurrent_futures
+except ImportError:
+    concurrent_futures = None
 import usb1
 import libusb1
+import ctypes
 from ctypes import pointer
 
 buff_len = 1024
@@ -62,6 +74,48 @@ class PollDetector(object):
     def __getattr__(self, name):
         return getattr(self.__poll, name)
 
+class FakeHandle(object):
+    """
+    Provides USBDeviceHandle.getTransfer, without needing any device.
+    """
+    def __init__(self):
+        self.transfer_list = []
+
+    def getTransfer(self, iso_packets=0):
+        transfer = USBTransferTests.getTransfer(iso_packets)
+        self.transfer_list.append(transfer)
+        return transfer
+
+def fakeCompletion(transfer, status, actual_length):
+    """
+    Simulate libusb calling given transfer's completion callback.
+    """
+    c_transfer = transfer._USBTransfer__transfer
+    c_transfer.contents.status = status
+    c_transfer.contents.actual_length = actual_length
+    transfer._USBTransfer__callbackWrapper(c_transfer)
+
+def getFakeDeviceHandle():
+    """
+    Returns an USBDeviceHandle without any device, whose transfers are
+    recorded in returned lists instead of being submitted and cancelled.
+    """
+    fake_handle = FakeHandle()
+    submitted_list = []
+    cancelled_list = []
+    def getTransfer(iso_packets=0):
+        transfer = fake_handle.getTransfer(iso_packets)
+        transfer.submit = (
+            lambda transfer=transfer: submitted_list.append(transfer)
+        )
+        transfer.cancel = (
+            lambda transfer=transfer: cancelled_list.append(transfer)
+        )
+        return transfer
+    handle = usb1.USBDeviceHandle(None, None, None)
+    handle.getTransfer = getTransfer
+    return handle, submitted_list, cancelled_list
+
 class USBTransferTests(unittest.TestCase):
     @staticmethod
     def getTransfer(iso_packets=0):
@@ -191,6 +245,161 @@ class USBTransferTests(unittest.TestCase):
             itertools.chain(*[x for _, x in transfer.iterISO()])),
             buff,
         )
+        # By default, buffers are views on transfer buffer.
+        view_list = transfer.getISOBufferList()
+        copy_list = transfer.getISOBufferList(copy=True)
+        iso_view = next(transfer.iterISO())[1]
+        iso_copy = next(transfer.iterISO(copy=True))[1]
+        self.assertEqual(view_list, copy_list)
+        transfer.getBuffer()[0] ^= 0xff
+        self.assertEqual(view_list[0][0], buffer_base[0] ^ 0xff)
+        self.assertEqual(iso_view[0], buffer_base[0] ^ 0xff)
+        self.assertEqual(copy_list[0][0], buffer_base[0])
+        self.assertEqual(iso_copy[0], buffer_base[0])
+
+    def testGetISOSetupArray(self):
+        """
+        getISOSetupArray exposes ISO packet descriptors without copying them.
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise unittest.SkipTest('numpy missing')
+        transfer = self.getTransfer(4)
+        transfer.setIsochronous(
+            0x81, 64, iso_transfer_length_list=[8, 16, 24, 16],
+        )
+        setup_array = transfer.getISOSetupArray()
+        self.assertEqual(list(setup_array['length']), [8, 16, 24, 16])
+        self.assertEqual(
+            list(numpy.cumsum(setup_array['length'])), [8, 24, 48, 64],
+        )
+        c_transfer = transfer._USBTransfer__transfer
+        libusb1.get_iso_packet_list(c_transfer)[2].actual_length = 5
+        self.assertEqual(list(setup_array['actual_length']), [0, 0, 5, 0])
+        self.assertEqual(
+            [x['actual_length'] for x in transfer.getISOSetupList()],
+            [0, 0, 5, 0],
+        )
+        self.assertRaises(TypeError, self.getTransfer().getISOSetupArray)
+
+    def testGetISOBuffer(self):
+        """
+        getISOBuffer returns individual packets, consistently with
+        getISOBufferList.
+        """
+        transfer = self.getTransfer(4)
+        transfer.setIsochronous(
+            0x81, bytearray(range(64)),
+            iso_transfer_length_list=[8, 16, 24, 16],
+        )
+        buffer_list = transfer.getISOBufferList()
+        self.assertEqual([len(x) for x in buffer_list], [8, 16, 24, 16])
+        for index, packet in enumerate(buffer_list):
+            self.assertEqual(transfer.getISOBuffer(index), packet)
+        self.assertEqual(transfer.getISOBuffer(2)[0], 24)
+        self.assertEqual(transfer.getISOBuffer(-1), buffer_list[-1])
+        self.assertRaises(IndexError, transfer.getISOBuffer, 4)
+        self.assertRaises(
+            ValueError, transfer.setIsochronous, 0x81, 64,
+            iso_transfer_length_list=[32, 0, 32],
+        )
+        self.assertRaises(TypeError, self.getTransfer().getISOBuffer, 0)
+        # Not an iso transfer anymore.
+        transfer.setBulk(0x81, 4)
+        self.assertRaises(TypeError, transfer.getISOBuffer, 1)
+
+    def testGetBufferView(self):
+        """
+        getBufferView returns received data without copying it.
+        """
+        transfer = self.getTransfer()
+        transfer.setBulk(0x81, 16)
+        fakeCompletion(transfer, usb1.TRANSFER_COMPLETED, 4)
+        view = transfer.getBufferView()
+        self.assertEqual(len(view), 4)
+        transfer.getBuffer()[:4] = b'spam'
+        self.assertEqual(view, b'spam')
+        transfer.setControl(usb1.TYPE_VENDOR, 1, 2, 3, b'eggs')
+        c_transfer = transfer._USBTransfer__transfer
+        self.assertEqual(
+            libusb1.libusb_control_transfer_get_data(c_transfer), b'eggs',
+        )
+        fakeCompletion(transfer, usb1.TRANSFER_COMPLETED, 3)
+        self.assertEqual(transfer.getBufferView(), b'egg')
+
+    def testRearm(self):
+        """
+        rearm changes length and data without replacing transfer buffer.
+        """
+        transfer = self.getTransfer()
+        self.assertRaises(ValueError, transfer.rearm)
+        transfer.setBulk(0x01, bytearray(b'abcdefgh'))
+        c_transfer = transfer._USBTransfer__transfer.contents
+        c_buffer = c_transfer.buffer
+        transfer.rearm(b'xyz')
+        self.assertEqual(c_transfer.length, 3)
+        self.assertEqual(c_transfer.buffer, c_buffer)
+        self.assertEqual(transfer.getBuffer(), b'xyzdefgh')
+        transfer.rearm(8)
+        self.assertEqual(c_transfer.length, 8)
+        transfer.rearm()
+        self.assertEqual(c_transfer.length, 8)
+        self.assertRaises(ValueError, transfer.rearm, 9)
+        if sys.version_info[0] == 3:
+            # Length is counted in bytes, whatever the item size.
+            data = array.array('H', [1, 2])
+            transfer.rearm(data)
+            self.assertEqual(c_transfer.length, 4)
+            self.assertEqual(transfer.getBuffer()[:4], data.tobytes())
+            transfer.rearm(8)
+        transfer.setControl(usb1.TYPE_VENDOR, 1, 2, 3, 4)
+        self.assertRaises(ValueError, transfer.rearm, 4)
+        transfer = self.getTransfer(2)
+        transfer.setIsochronous(0x81, 8)
+        transfer.rearm(b'01234567')
+        self.assertEqual(transfer.getBuffer(), b'01234567')
+        self.assertRaises(ValueError, transfer.rearm, 4)
+
+    def testSetBulkStream(self):
+        """
+        Bulk stream transfers carry their stream id.
+        """
+        if not hasattr(libusb1, 'libusb_transfer_get_stream_id'):
+            raise unittest.SkipTest('libusb without bulk streams')
+        transfer = self.getTransfer()
+        self.assertEqual(transfer.getStreamID(), 0)
+        transfer.setBulkStream(0x81, 5, 16)
+        self.assertEqual(transfer.getType(), usb1.TRANSFER_TYPE_BULK_STREAM)
+        self.assertEqual(transfer.getStreamID(), 5)
+        self.assertEqual(len(transfer.getBuffer()), 16)
+        transfer.setBulk(0x81, 16)
+        self.assertEqual(transfer.getStreamID(), 0)
+
+    def testSetBulkStreamUnsupported(self):
+        """
+        Without libusb bulk stream support, setBulkStream raises
+        AttributeError and leaves transfer untouched.
+        """
+        transfer = self.getTransfer()
+        transfer.setBulk(0x81, 16)
+        original = getattr(usb1.libusb1, 'libusb_transfer_set_stream_id', None)
+        if original is not None:
+            del usb1.libusb1.libusb_transfer_set_stream_id
+        try:
+            self.assertRaises(
+                AttributeError, transfer.setBulkStream, 0x81, 5, 8,
+            )
+            self.assertRaises(
+                AttributeError, usb1.libusb1.libusb_fill_bulk_stream_transfer,
+                transfer._USBTransfer__transfer, None, 0x81, 5, None, 0,
+                None, None, 0,
+            )
+        finally:
+            if original is not None:
+                usb1.libusb1.libusb_transfer_set_stream_id = original
+        self.assertEqual(transfer.getType(), usb1.TRANSFER_TYPE_BULK)
+        self.assertEqual(len(transfer.getBuffer()), 16)
 
     def testSetGetCallback(self):
         transfer = self.getTransfer()
@@ -200,6 +409,527 @@ class USBTransferTests(unittest.TestCase):
         got_callback = transfer.getCallback()
         self.assertEqual(callback, got_callback)
 
+    def testTransferPool(self):
+        """
+        Closed transfers go back to their pool, unless doomed or pool is full.
+        """
+        # pylint: disable=protected-access
+        pool = usb1._TransferPool()
+        # pylint: enable=protected-access
+        pool.limit = 1
+        def getTransfer(iso_packets=0):
+            return usb1.USBTransfer(
+                pointer(libusb1.libusb_device_handle()),
+                iso_packets, lambda x: None, lambda x: None, pool.put)
+        self.assertEqual(pool.get(0), None)
+        transfer = getTransfer()
+        transfer.setBulk(0x81, buff_len)
+        transfer.close()
+        self.assertEqual(len(pool), 1)
+        # Closing again is harmless.
+        transfer.close()
+        self.assertEqual(len(pool), 1)
+        # Pooled transfer was reset.
+        self.assertEqual(transfer.getBuffer(), None)
+        self.assertRaises(ValueError, transfer.submit)
+        self.assertTrue(pool.get(1) is None)
+        self.assertTrue(pool.get(0) is transfer)
+        self.assertEqual(len(pool), 0)
+        transfer.setBulk(0x81, buff_len)
+        other_transfer = getTransfer()
+        transfer.close()
+        # Pool is full.
+        other_transfer.close()
+        self.assertEqual(len(pool), 1)
+        self.assertRaises(
+            usb1.DoomedTransferError, other_transfer.setBulk, 0x81, 1,
+        )
+        # Doomed transfers are not pooled.
+        transfer = pool.get(0)
+        transfer.doom()
+        transfer.close()
+        self.assertEqual(len(pool), 0)
+        self.assertEqual(
+            (pool.hit_count, pool.miss_count, pool.discard_count),
+            (2, 2, 1),
+        )
+
+    def testBufferArena(self):
+        """
+        Arena slots can be used as transfer buffers, without copy.
+        """
+        slab_count = 4
+        arena = usb1.USBBufferArena(buff_len, slab_count)
+        self.assertEqual(arena.getSlabSize(), buff_len)
+        slot_list = [arena.borrow() for _ in range(slab_count)]
+        self.assertEqual(len(arena), 0)
+        self.assertRaises(IndexError, arena.borrow)
+        slot = slot_list.pop()
+        slot.buffer[:] = bytearray_buff
+        for setter_id, iso_packets in (
+                    ('setBulk', 0),
+                    ('setInterrupt', 0),
+                    ('setIsochronous', 16),
+                ):
+            transfer = self.getTransfer(iso_packets)
+            getattr(transfer, setter_id)(0x01, slot)
+            self.assertEqual(transfer.getBuffer(), bytearray_buff)
+            transfer.setBuffer(slot_list[0])
+            self.assertEqual(len(transfer.getBuffer()), buff_len)
+            # Shares memory with slot
+            slot_list[0].buffer[0] = 42
+            self.assertEqual(transfer.getBuffer()[0], 42)
+        arena.release(slot)
+        self.assertEqual(len(arena), 1)
+        # Arena carved from caller-provided memory.
+        backing = bytearray(buff_len * 2)
+        arena = usb1.USBBufferArena(buff_len, 2, backing)
+        arena.borrow().buffer[0] = 42
+        self.assertEqual(42, max(backing))
+        self.assertRaises(
+            ValueError, usb1.USBBufferArena, buff_len, 3, backing,
+        )
+
+    def testDeviceMemory(self):
+        """
+        Device memory is used when libusb provides it and freed on handle
+        close, with a bytearray fallback otherwise.
+        """
+        handle = usb1.USBDeviceHandle(None, 'handle', None)
+        freed_list = []
+        handle._USBDeviceHandle__libusb_close = lambda handle: None
+        handle._USBDeviceHandle__libusb_dev_mem_free = (
+            lambda handle, address, length: freed_list.append(
+                (address, length),
+            )
+        )
+        original = getattr(usb1.libusb1, 'libusb_dev_mem_alloc', None)
+        backing = ctypes.create_string_buffer(buff_len)
+        try:
+            usb1.libusb1.libusb_dev_mem_alloc = lambda handle, length: None
+            memory = handle.getDeviceMemory(buff_len)
+            self.assertTrue(isinstance(memory, bytearray))
+            self.assertEqual(len(memory), buff_len)
+            usb1.libusb1.libusb_dev_mem_alloc = (
+                lambda handle, length: ctypes.addressof(backing)
+            )
+            arena = handle.getBufferArena(buff_len // 2, 2)
+        finally:
+            if original is None:
+                del usb1.libusb1.libusb_dev_mem_alloc
+            else:
+                usb1.libusb1.libusb_dev_mem_alloc = original
+        slot = arena.borrow()
+        slot.buffer[:] = bytearray_buff[:buff_len // 2]
+        self.assertEqual(
+            backing.raw[buff_len // 2:],
+            bytes(bytearray_buff[:buff_len // 2]),
+        )
+        transfer = self.getTransfer()
+        transfer.setBulk(0x81, slot)
+        self.assertEqual(
+            transfer._USBTransfer__transfer.contents.buffer,
+            ctypes.addressof(backing) + buff_len // 2,
+        )
+        handle.close()
+        self.assertEqual(freed_list, [(ctypes.addressof(backing), buff_len)])
+
+    def testSharedCallback(self):
+        """
+        All transfers share a single ctypes callback, which finds the python
+        transfer from C user_data.
+        """
+        called_list = []
+        transfer_list = [self.getTransfer() for _ in range(2)]
+        for transfer in transfer_list:
+            transfer.setBulk(0x81, 16, callback=called_list.append)
+        self.assertNotEqual(
+            transfer_list[0]._USBTransfer__transfer.contents.user_data,
+            transfer_list[1]._USBTransfer__transfer.contents.user_data,
+        )
+        usb1.USBTransfer._USBTransfer__ctypesCallbackWrapper(
+            transfer_list[1]._USBTransfer__transfer,
+        )
+        self.assertEqual(called_list, transfer_list[1:])
+        # No reference cycle: freed without the help of the garbage collector.
+        transfer_ref = weakref.ref(transfer_list.pop())
+        del called_list[:], transfer
+        self.assertTrue(transfer_ref() is None)
+
+    def testCompletionQueue(self):
+        """
+        Transfers with a completion queue are queued instead of having their
+        callback called.
+        """
+        queue = usb1.USBCompletionQueue()
+        called_list = []
+        transfer_list = []
+        for _ in range(3):
+            transfer = self.getTransfer()
+            transfer.setBulk(0x81, 16, callback=called_list.append)
+            transfer.setCompletionQueue(queue)
+            self.assertTrue(transfer.getCompletionQueue() is queue)
+            transfer_list.append(transfer)
+        for transfer in transfer_list:
+            fakeCompletion(transfer, usb1.TRANSFER_COMPLETED, 0)
+        self.assertEqual(called_list, [])
+        self.assertEqual(queue.drain(2), transfer_list[:2])
+        self.assertEqual(queue.drain(), transfer_list[2:])
+        self.assertEqual(queue.drain(), [])
+        transfer_list[0].setCompletionQueue(None)
+        fakeCompletion(transfer_list[0], usb1.TRANSFER_COMPLETED, 0)
+        self.assertEqual(called_list, transfer_list[:1])
+        self.assertEqual(len(queue), 0)
+
+    def testBulkReader(self):
+        """
+        Completed transfers are delivered in order, errors are raised after
+        already-received data.
+        """
+        handle = FakeHandle()
+        reader = usb1.USBBulkReader(handle, None, 0x01, 16, 3, 0, None)
+        self.assertEqual(len(handle.transfer_list), 3)
+        transfer_a, transfer_b, transfer_c = handle.transfer_list
+        self.assertEqual(transfer_a.getEndpoint(), 0x81)
+        transfer_a.getBuffer()[:4] = b'abcd'
+        transfer_b.getBuffer()[:4] = b'efgh'
+        fakeCompletion(transfer_a, usb1.TRANSFER_COMPLETED, 4)
+        fakeCompletion(transfer_b, usb1.TRANSFER_TIMED_OUT, 2)
+        fakeCompletion(transfer_c, usb1.TRANSFER_STALL, 0)
+        self.assertEqual(reader.read(), b'abcd')
+        self.assertEqual(reader.read(), b'ef')
+        self.assertRaises(usb1.USBErrorPipe, reader.read)
+        self.assertEqual(reader.read(), None)
+        statistics = reader.getStatistics()
+        self.assertEqual(statistics['transfers'], 2)
+        self.assertEqual(statistics['bytes'], 6)
+        received_list = []
+        reader = usb1.USBBulkReader(
+            handle, None, 0x81, 16, 1, 0,
+            lambda data: received_list.append(data.tobytes()),
+        )
+        transfer = handle.transfer_list[-1]
+        transfer.getBuffer()[:3] = b'ijk'
+        fakeCompletion(transfer, usb1.TRANSFER_COMPLETED, 3)
+        self.assertEqual(received_list, [b'ijk'])
+        self.assertRaises(ValueError, reader.read)
+
+    def testStreamStartSubmitError(self):
+        """
+        Streaming stops submitting transfers on first submission failure.
+        """
+        def submit():
+            submit_list.append(None)
+            raise usb1.USBErrorNoDevice
+        for stream_factory in (
+                    lambda handle: usb1.USBBulkReader(
+                        handle, None, 0x81, 16, 3, 0, None,
+                    ),
+                    lambda handle: usb1.USBIsochronousWriter(
+                        handle, None, 0x01, 4, 2, 3, 0, None,
+                    ),
+                ):
+            handle = FakeHandle()
+            stream = stream_factory(handle)
+            submit_list = []
+            for transfer in handle.transfer_list:
+                transfer.submit = submit
+            stream.start()
+            self.assertEqual(len(submit_list), 1)
+            self.assertFalse(stream.isRunning())
+            self.assertTrue(
+                isinstance(stream.getError(), usb1.USBErrorNoDevice),
+            )
+
+    def testChunkedTransfer(self):
+        """
+        Large bulk transfers are split in max packet size-aligned chunks,
+        reassembled in order, and stop at first short packet.
+        """
+        class FakeDevice(object):
+            @staticmethod
+            def getMaxPacketSize(endpoint):
+                return 4
+        fake_handle = FakeHandle()
+        device_data = bytearray(b'abcdefghij')
+        status_list = []
+        length_list = []
+        endpoint_list = []
+        def submit(transfer):
+            # Complete transfer immediately, as a device would.
+            buf = transfer.getBuffer()
+            length = len(buf)
+            length_list.append(length)
+            endpoint_list.append(transfer.getEndpoint())
+            if transfer.getEndpoint() & usb1.ENDPOINT_IN:
+                length = min(length, len(device_data))
+                buf[:length] = device_data[:length]
+                del device_data[:length]
+            status = status_list.pop(0) if status_list else \
+                usb1.TRANSFER_COMPLETED
+            fakeCompletion(transfer, status, length)
+        def getTransfer(iso_packets=0):
+            transfer = fake_handle.getTransfer(iso_packets)
+            transfer.submit = lambda: submit(transfer)
+            transfer.cancel = lambda: None
+            return transfer
+        handle = usb1.USBDeviceHandle(None, None, FakeDevice())
+        handle.getTransfer = getTransfer
+        self.assertEqual(
+            handle.bulkReadChunked(0x01, 32, chunk_size=10, depth=2),
+            b'abcdefghij',
+        )
+        self.assertEqual(length_list, [8, 8])
+        self.assertEqual(endpoint_list, [0x81, 0x81])
+        del length_list[:], endpoint_list[:]
+        self.assertEqual(
+            handle.bulkWriteChunked(
+                0x81, bytearray(16), chunk_size=8, zero_packet=True,
+            ),
+            16,
+        )
+        self.assertEqual(length_list, [8, 8, 0])
+        self.assertEqual(endpoint_list, [0x01, 0x01, 0x01])
+        del length_list[:]
+        status_list[:] = [usb1.TRANSFER_COMPLETED, usb1.TRANSFER_STALL]
+        self.assertRaises(
+            usb1.USBErrorPipe, handle.bulkWriteChunked, 0x01, bytearray(24),
+            chunk_size=8, depth=1,
+        )
+        self.assertEqual(length_list, [8, 8])
+        # Data received before a timeout is not lost.
+        device_data[:] = b'abcdefghijk'
+        status_list[:] = [usb1.TRANSFER_COMPLETED, usb1.TRANSFER_TIMED_OUT]
+        try:
+            handle.bulkReadChunked(0x81, 32, chunk_size=8, depth=1)
+        except usb1.USBErrorTimeout as exc:
+            self.assertEqual(exc.transferred, 11)
+            self.assertEqual(exc.received, b'abcdefghijk')
+        else:
+            self.fail('USBErrorTimeout not raised')
+
+    def testIsochronousReader(self):
+        """
+        Received packets are delivered in order, and accounted.
+        """
+        handle = FakeHandle()
+        reader = usb1.USBIsochronousReader(
+            handle, None, 0x01, 4, 3, 2, 0, None,
+        )
+        submitted_list = []
+        for transfer in handle.transfer_list:
+            self.assertEqual(transfer.getEndpoint(), 0x81)
+            self.assertEqual(
+                [len(x) for x in transfer.getISOBufferList()], [4, 4, 4],
+            )
+            transfer.submit = (
+                lambda transfer=transfer: submitted_list.append(transfer)
+            )
+        reader.start()
+        transfer_a, transfer_b = handle.transfer_list
+        self.assertEqual(submitted_list, [transfer_a, transfer_b])
+        del submitted_list[:]
+        transfer_a.getBuffer()[:] = b'abcdefghijkl'
+        c_transfer = transfer_a._USBTransfer__transfer
+        packet_a, packet_b, packet_c = libusb1.get_iso_packet_list(c_transfer)
+        packet_a.actual_length = 4
+        packet_b.status = usb1.TRANSFER_ERROR
+        packet_c.actual_length = 2
+        fakeCompletion(transfer_a, usb1.TRANSFER_COMPLETED, 0)
+        self.assertEqual(submitted_list, [transfer_a])
+        self.assertEqual(reader.read(), b'abcd')
+        self.assertEqual(reader.read(), b'ij')
+        fakeCompletion(transfer_b, usb1.TRANSFER_COMPLETED, 0)
+        statistics = reader.getStatistics()
+        self.assertEqual(statistics['transfers'], 2)
+        self.assertEqual(statistics['bytes'], 6)
+        self.assertEqual(statistics['packets'], 6)
+        self.assertEqual(statistics['errored_packets'], 1)
+        self.assertEqual(statistics['short_packets'], 1)
+        self.assertEqual(statistics['missed_packets'], 3)
+        self.assertTrue(statistics['resubmit_latency_max'] >= 0)
+        fakeCompletion(transfer_a, usb1.TRANSFER_NO_DEVICE, 0)
+        self.assertRaises(usb1.USBErrorNoDevice, reader.read)
+
+    def testIsochronousWriter(self):
+        """
+        Transfers are filled from written data, and completed with zeroes
+        when data is missing.
+        """
+        handle = FakeHandle()
+        writer = usb1.USBIsochronousWriter(
+            handle, None, 0x81, 2, 2, 2, 0, None,
+        )
+        submitted_list = []
+        for transfer in handle.transfer_list:
+            self.assertEqual(transfer.getEndpoint(), 0x01)
+            transfer.submit = (
+                lambda transfer=transfer: submitted_list.append(transfer)
+            )
+        writer.write(b'abcdef')
+        writer.start()
+        transfer_a, transfer_b = handle.transfer_list
+        self.assertEqual(submitted_list, [transfer_a, transfer_b])
+        del submitted_list[:]
+        self.assertEqual(transfer_a.getBuffer(), b'abcd')
+        self.assertEqual(transfer_b.getBuffer(), b'ef\x00\x00')
+        self.assertEqual(writer.getBufferedLength(), 0)
+        writer.write(b'ghij')
+        c_transfer = transfer_a._USBTransfer__transfer
+        for packet in libusb1.get_iso_packet_list(c_transfer):
+            packet.actual_length = packet.length
+        fakeCompletion(transfer_a, usb1.TRANSFER_COMPLETED, 0)
+        self.assertEqual(submitted_list, [transfer_a])
+        self.assertEqual(transfer_a.getBuffer(), b'ghij')
+        statistics = writer.getStatistics()
+        self.assertEqual(statistics['transfers'], 1)
+        self.assertEqual(statistics['bytes'], 4)
+        self.assertEqual(statistics['late'], 1)
+        writer.stop(wait=False)
+        produced_list = []
+        def producer(data):
+            produced_list.append(len(data))
+            data[:3] = b'klm'
+            return 3
+        writer = usb1.USBIsochronousWriter(
+            handle, None, 0x01, 2, 2, 1, 0, producer,
+        )
+        transfer = handle.transfer_list[-1]
+        transfer.submit = lambda: None
+        writer.start()
+        self.assertEqual(produced_list, [4])
+        self.assertEqual(transfer.getBuffer(), b'klm\x00')
+        self.assertRaises(ValueError, writer.write, b'')
+        # Invalid producer return values are reported.
+        for invalid in (None, 5, -1):
+            writer = usb1.USBIsochronousWriter(
+                handle, None, 0x01, 2, 2, 1, 0, lambda data: invalid,
+            )
+            transfer = handle.transfer_list[-1]
+            transfer.submit = lambda: None
+            self.assertRaises(ValueError, writer.start)
+            self.assertFalse(writer.isRunning())
+        length_list = [4, None]
+        writer = usb1.USBIsochronousWriter(
+            handle, None, 0x01, 2, 2, 1, 0, lambda data: length_list.pop(0),
+        )
+        transfer = handle.transfer_list[-1]
+        transfer.submit = lambda: None
+        writer.start()
+        fakeCompletion(transfer, usb1.TRANSFER_COMPLETED, 0)
+        self.assertTrue(isinstance(writer.getError(), ValueError))
+
+    def testIsochronousWriterConcurrentWrite(self):
+        """
+        Data can be written while a transfer is being filled from another
+        thread.
+        """
+        handle = FakeHandle()
+        writer = usb1.USBIsochronousWriter(
+            handle, None, 0x01, 2, 2, 1, 0, None,
+        )
+        transfer, = handle.transfer_list
+        transfer.submit = lambda: None
+        error_list = []
+        def write():
+            try:
+                writer.write(b'ef')
+            except Exception: # pylint: disable=broad-except
+                error_list.append(sys.exc_info()[1])
+        thread_list = []
+        slot_buffer = transfer.getUserData().buffer
+        class SlowBuffer(object):
+            """
+            Transfer buffer, writing concurrently on first modification.
+            """
+            def __len__(self):
+                return len(slot_buffer)
+
+            def __setitem__(self, key, value):
+                if not thread_list:
+                    thread = threading.Thread(target=write)
+                    thread.daemon = True
+                    thread.start()
+                    thread_list.append(thread)
+                    # Let write run as far as it can.
+                    thread.join(0.1)
+                slot_buffer[key] = value
+        class SlowSlot(object):
+            buffer = SlowBuffer()
+        transfer.setUserData(SlowSlot())
+        writer.write(b'abcd')
+        writer.start()
+        thread, = thread_list
+        thread.join()
+        self.assertEqual(error_list, [])
+        self.assertEqual(transfer.getBuffer(), b'abcd')
+        self.assertEqual(writer.getBufferedLength(), 2)
+
+    def testBulkWriter(self):
+        """
+        Written data is split among idle transfers.
+        """
+        handle = FakeHandle()
+        writer = usb1.USBBulkWriter(handle, None, 0x81, 16, 3, 0)
+        submitted_list = []
+        for transfer in handle.transfer_list:
+            self.assertEqual(transfer.getEndpoint(), 0x01)
+            transfer.submit = (
+                lambda transfer=transfer: submitted_list.append(transfer)
+            )
+        data = bytes(bytearray(range(40)))
+        self.assertEqual(writer.write(data), 40)
+        length_list = [
+            x._USBTransfer__transfer.contents.length for x in submitted_list
+        ]
+        self.assertEqual(length_list, [16, 16, 8])
+        self.assertEqual(
+            b''.join(
+                x.getBuffer()[:y].tobytes()
+                for x, y in zip(submitted_list, length_list)
+            ),
+            data,
+        )
+        for transfer, length in zip(submitted_list, length_list):
+            fakeCompletion(transfer, usb1.TRANSFER_COMPLETED, length)
+        self.assertEqual(writer.getStatistics()['bytes'], 40)
+        if sys.version_info[0] == 3:
+            # Data is split in bytes, whatever the item size.
+            del submitted_list[:]
+            data = array.array('H', range(10))
+            self.assertEqual(writer.write(data), 20)
+            self.assertEqual(
+                b''.join(
+                    x.getBuffer()[:x._USBTransfer__transfer.contents.length]
+                    for x in submitted_list
+                ),
+                data.tobytes(),
+            )
+        fakeCompletion(submitted_list[0], usb1.TRANSFER_NO_DEVICE, 0)
+        self.assertRaises(usb1.USBErrorNoDevice, writer.write, data)
+
+    def testBulkWriterSubmitError(self):
+        """
+        A transfer which failed to submit is still available for next write.
+        """
+        handle = FakeHandle()
+        writer = usb1.USBBulkWriter(handle, None, 0x81, 16, 2, 0)
+        submitted_list = []
+        def submit(transfer):
+            if not submitted_list:
+                submitted_list.append(None)
+                raise usb1.USBErrorNoDevice
+            submitted_list.append(transfer)
+        for transfer in handle.transfer_list:
+            transfer.submit = lambda transfer=transfer: submit(transfer)
+        for _ in range(2):
+            self.assertRaises(usb1.USBErrorNoDevice, writer.write, b'a')
+            del submitted_list[:]
+        # Would block handling events if any transfer was lost.
+        submitted_list.append(None)
+        self.assertEqual(writer.write(bytearray(32)), 32)
+        self.assertEqual(len(submitted_list), 3)
+
     def testUSBPollerThreadExit(self):
         """
         USBPollerThread must exit by itself when context is destroyed.
@@ -244,6 +974,307 @@ class USBTransferTests(unittest.TestCase):
             self.assertTrue(exception_list, exception_list)
             self.assertTrue(poller.is_alive())
 
+    def testUSBAsyncioPoller(self):
+        """
+        USBAsyncioPoller registers libusb file descriptors with event loop.
+        """
+        if asyncio is None:
+            raise unittest.SkipTest('asyncio missing')
+        loop = asyncio.new_event_loop()
+        try:
+            with USBContext() as context:
+                try:
+                    fd_list = context.getPollFDList()
+                except NotImplementedError:
+                    raise unittest.SkipTest(
+                        'libusb without file descriptor events')
+                poller = usb1.USBAsyncioPoller(context, loop)
+                self.assertTrue(poller.getLoop() is loop)
+                loop.run_until_complete(asyncio.sleep(0))
+                poller.close()
+                poller = usb1.USBAsyncioPoller(context, loop)
+                for fd, events in fd_list:
+                    if events & select.POLLIN:
+                        # Registered by poller
+                        self.assertTrue(loop.remove_reader(fd))
+                poller.close()
+                if hasattr(asyncio, '_get_running_loop'):
+                    # No running loop to default to.
+                    self.assertRaises(
+                        RuntimeError, usb1.USBAsyncioPoller, context,
+                    )
+                # Defaults to running loop.
+                poller_list = []
+                loop.call_soon(
+                    lambda: poller_list.append(
+                        usb1.USBAsyncioPoller(context),
+                    ),
+                )
+                loop.run_until_complete(asyncio.sleep(0))
+                poller, = poller_list
+                self.assertTrue(poller.getLoop() is loop)
+                poller.close()
+        finally:
+            loop.close()
+
+    def testAsyncioTransfer(self):
+        """
+        Asynchronous transfer methods resolve asyncio futures on completion.
+        """
+        if asyncio is None:
+            raise unittest.SkipTest('asyncio missing')
+        handle, submitted_list, cancelled_list = getFakeDeviceHandle()
+        loop = asyncio.new_event_loop()
+        try:
+            future = handle.bulkReadAsync(0x01, 16, loop=loop)
+            transfer = submitted_list.pop()
+            self.assertEqual(transfer.getEndpoint(), 0x81)
+            transfer.getBuffer()[:3] = b'foo'
+            fakeCompletion(transfer, usb1.TRANSFER_COMPLETED, 3)
+            self.assertEqual(loop.run_until_complete(future), b'foo')
+            future = handle.controlWriteAsync(
+                usb1.TYPE_VENDOR, 1, 2, 3, b'bar', loop=loop,
+            )
+            fakeCompletion(submitted_list.pop(), usb1.TRANSFER_STALL, 0)
+            self.assertRaises(
+                usb1.USBErrorPipe, loop.run_until_complete, future,
+            )
+            if hasattr(asyncio, '_get_running_loop'):
+                self.assertRaises(
+                    RuntimeError, handle.bulkReadAsync, 0x01, 16,
+                )
+            future_list = []
+            loop.call_soon(
+                lambda: future_list.append(handle.bulkReadAsync(0x01, 16)),
+            )
+            loop.run_until_complete(asyncio.sleep(0))
+            future, = future_list
+            transfer = submitted_list.pop()
+            transfer.getBuffer()[:3] = b'baz'
+            fakeCompletion(transfer, usb1.TRANSFER_COMPLETED, 3)
+            self.assertEqual(loop.run_until_complete(future), b'baz')
+            future = handle.interruptReadAsync(0x81, 8, loop=loop)
+            transfer = submitted_list.pop()
+            future.cancel()
+            loop.run_until_complete(asyncio.sleep(0))
+            self.assertEqual(cancelled_list, [transfer])
+            fakeCompletion(transfer, usb1.TRANSFER_CANCELLED, 0)
+            loop.run_until_complete(asyncio.sleep(0))
+        finally:
+            loop.close()
+
+    def testConcurrentTransfer(self):
+        """
+        Future-returning transfer methods resolve concurrent.futures futures
+        on completion.
+        """
+        if concurrent_futures is None:
+            raise unittest.SkipTest('concurrent.futures missing')
+        handle, submitted_list, cancelled_list = getFakeDeviceHandle()
+        read_future = handle.interruptReadFuture(0x01, 16)
+        write_future = handle.bulkWriteFuture(0x81, b'foo')
+        read_transfer, write_transfer = submitted_list
+        del submitted_list[:]
+        self.assertEqual(read_transfer.getEndpoint(), 0x81)
+        self.assertEqual(write_transfer.getEndpoint(), 0x01)
+        read_transfer.getBuffer()[:2] = b'ba'
+        fakeCompletion(read_transfer, usb1.TRANSFER_COMPLETED, 2)
+        fakeCompletion(write_transfer, usb1.TRANSFER_TIMED_OUT, 0)
+        done, not_done = concurrent_futures.wait(
+            [read_future, write_future], timeout=0,
+        )
+        self.assertEqual(len(done), 2)
+        self.assertFalse(not_done)
+        self.assertEqual(read_future.result(), b'ba')
+        self.assertTrue(
+            isinstance(write_future.exception(), usb1.USBErrorTimeout),
+        )
+        future = handle.controlReadFuture(usb1.TYPE_VENDOR, 1, 2, 3, 4)
+        transfer = submitted_list.pop()
+        self.assertTrue(future.cancel())
+        self.assertEqual(cancelled_list, [transfer])
+        fakeCompletion(transfer, usb1.TRANSFER_CANCELLED, 0)
+        self.assertTrue(future.cancelled())
+
+    def testConcurrentTransferCancelRace(self):
+        """
+        Cancelling a future while its transfer completes does not cancel
+        the transfer once it is closed (and possibly reused).
+        """
+        if concurrent_futures is None:
+            raise unittest.SkipTest('concurrent.futures missing')
+        handle, submitted_list, cancelled_list = getFakeDeviceHandle()
+        future = handle.bulkReadFuture(0x81, 16)
+        transfer, = submitted_list
+        getStatus = transfer.getStatus
+        def getStatusWhileCancelling():
+            thread = threading.Thread(target=future.cancel)
+            thread.daemon = True
+            thread.start()
+            # Let cancel run as far as it can.
+            thread.join(0.2)
+            self.assertEqual(cancelled_list, [])
+            return getStatus()
+        transfer.getStatus = getStatusWhileCancelling
+        fakeCompletion(transfer, usb1.TRANSFER_COMPLETED, 0)
+        self.assertEqual(cancelled_list, [])
+
+    def testReadInto(self):
+        """
+        *ReadInto methods let libusb write directly into caller's buffer.
+        """
+        handle, _, _ = getFakeDeviceHandle()
+        call_list = []
+        def fakeTransfer(endpoint, data, length, timeout):
+            call_list.append((endpoint, length, timeout))
+            ctypes.memmove(data, b'ab', 2)
+            return 2
+        handle._bulkTransfer = fakeTransfer
+        handle._interruptTransfer = fakeTransfer
+        handle._controlTransfer = (
+            lambda request_type, request, value, index, data, length,
+            timeout: fakeTransfer(request_type, data, length, timeout)
+        )
+        data = bytearray(8)
+        self.assertEqual(handle.bulkReadInto(0x01, data, 10), 2)
+        self.assertEqual(data, bytearray(b'ab' + b'\x00' * 6))
+        view = memoryview(bytearray(8))[4:]
+        self.assertEqual(handle.interruptReadInto(0x02, view), 2)
+        self.assertEqual(view.tobytes(), b'ab\x00\x00')
+        self.assertEqual(
+            handle.controlReadInto(usb1.TYPE_VENDOR, 1, 2, 3, data), 2,
+        )
+        self.assertEqual(call_list, [
+            (0x81, 8, 10),
+            (0x82, 4, 0),
+            (usb1.TYPE_VENDOR | usb1.ENDPOINT_IN, 8, 0),
+        ])
+        self.assertRaises(TypeError, handle.bulkReadInto, 0x81, b'foo')
+
+    def testPartialTransfer(self):
+        """
+        Synchronous transfer errors carry data transferred before the error.
+        """
+        handle, _, _ = getFakeDeviceHandle()
+        def fakeTransferStatus(endpoint, data, length, timeout):
+            ctypes.memmove(data, b'abc', 3)
+            return usb1.ERROR_TIMEOUT, 3
+        handle._bulkTransferStatus = fakeTransferStatus
+        handle._interruptTransferStatus = fakeTransferStatus
+        for method, kw in (
+                    (handle.bulkRead, {'length': 8}),
+                    (handle.interruptRead, {'length': 8}),
+                ):
+            try:
+                method(0x81, **kw)
+            except usb1.USBErrorTimeout as exc:
+                self.assertEqual(exc.transferred, 3)
+                self.assertEqual(exc.received, b'abc')
+            else:
+                self.fail('USBErrorTimeout not raised')
+        for method in (handle.bulkWrite, handle.interruptWrite):
+            try:
+                method(0x01, b'abcdef')
+            except usb1.USBErrorTimeout as exc:
+                self.assertEqual(exc.transferred, 3)
+            else:
+                self.fail('USBErrorTimeout not raised')
+
+    def testReadStatus(self):
+        """
+        *ReadStatus methods return error status instead of raising.
+        """
+        handle, _, _ = getFakeDeviceHandle()
+        status_list = [(usb1.ERROR_TIMEOUT, 0), (usb1.SUCCESS, 2)]
+        endpoint_list = []
+        def fakeTransferStatus(endpoint, data, length, timeout):
+            endpoint_list.append(endpoint)
+            ctypes.memmove(data, b'ab', 2)
+            return status_list.pop(0)
+        handle._bulkTransferStatus = fakeTransferStatus
+        handle._interruptTransferStatus = fakeTransferStatus
+        self.assertEqual(
+            handle.bulkReadStatus(0x01, 8), (usb1.ERROR_TIMEOUT, b''),
+        )
+        self.assertEqual(
+            handle.interruptReadStatus(0x02, 8), (usb1.SUCCESS, b'ab'),
+        )
+        self.assertEqual(endpoint_list, [0x81, 0x82])
+
+    def testPersistentSyncTransfers(self):
+        """
+        Synchronous transfers reuse one transfer per endpoint when enabled.
+        """
+        handle, submitted_list, _ = getFakeDeviceHandle()
+        completion_list = [
+            (usb1.TRANSFER_COMPLETED, 2),
+            (usb1.TRANSFER_COMPLETED, 3),
+            (usb1.TRANSFER_TIMED_OUT, 1),
+        ]
+        def waitTransfers(transfer_list, completed):
+            self.assertEqual(completed.value, 0)
+            for transfer in transfer_list:
+                transfer.getBuffer()[:3] = b'abc'
+                fakeCompletion(transfer, *completion_list.pop(0))
+            self.assertEqual(completed.value, 1)
+            completed.value = 0
+        handle._waitTransfers = waitTransfers
+        handle.setPersistentSyncTransfers(True)
+        self.assertEqual(handle.bulkRead(0x01, 8), b'ab')
+        self.assertEqual(handle.bulkWrite(0x01, b'abcdef'), 3)
+        try:
+            handle.bulkRead(0x01, 8)
+        except usb1.USBErrorTimeout as exc:
+            self.assertEqual(exc.received, b'a')
+        else:
+            self.fail('USBErrorTimeout not raised')
+        read_transfer, write_transfer, _ = submitted_list
+        self.assertTrue(read_transfer is submitted_list[2])
+        self.assertFalse(read_transfer is write_transfer)
+        self.assertEqual(read_transfer.getEndpoint(), 0x81)
+        self.assertEqual(write_transfer.getEndpoint(), 0x01)
+        # Caller's buffer is not referenced anymore.
+        self.assertEqual(len(read_transfer.getBuffer()), 0)
+        handle.setPersistentSyncTransfers(False)
+        self.assertFalse(read_transfer._USBTransfer__initialized)
+
+    def testPersistentSyncTransferEventError(self):
+        """
+        Event handling errors during a persistent synchronous transfer
+        reach the caller, with the data received before the error.
+        """
+        handle, submitted_list, cancelled_list = getFakeDeviceHandle()
+        wait_list = []
+        def waitTransfers(transfer_list, completed):
+            wait_list.append(transfer_list)
+            if len(wait_list) == 1:
+                raise usb1.USBErrorNoDevice
+            for transfer in transfer_list:
+                transfer.getBuffer()[:3] = b'abc'
+                fakeCompletion(transfer, usb1.TRANSFER_CANCELLED, 1)
+        handle._waitTransfers = waitTransfers
+        handle.setPersistentSyncTransfers(True)
+        try:
+            handle.bulkRead(0x01, 8)
+        except usb1.USBErrorNoDevice as exc:
+            self.assertEqual(exc.transferred, 1)
+            self.assertEqual(exc.received, b'a')
+        else:
+            self.fail('USBErrorNoDevice not raised')
+        self.assertEqual(cancelled_list, submitted_list)
+        self.assertEqual(len(wait_list), 2)
+        # Caller's buffer is not referenced anymore.
+        self.assertEqual(len(submitted_list[0].getBuffer()), 0)
+        def getTransfer(iso_packets=0):
+            raise usb1.USBErrorNoMem
+        handle.getTransfer = getTransfer
+        try:
+            handle.interruptRead(0x02, 8)
+        except usb1.USBErrorNoMem as exc:
+            self.assertEqual(exc.received, b'')
+        else:
+            self.fail('USBErrorNoMem not raised')
+
     @staticmethod
     def testDescriptors():
         """
@@ -323,6 +1354,101 @@ class USBTransferTests(unittest.TestCase):
         context.exit() # Deprecated
         self.assertEqual(context.getPollFDList(), None)
 
+    @staticmethod
+    def testHandleEventsCompleted():
+        """
+        Event handling returns immediately once completed flag is set, and
+        waits no longer than timeout otherwise.
+        """
+        with USBContext() as context:
+            context.handleEventsCompleted(ctypes.c_int(1))
+            context.handleEventsTimeoutCompleted(10, ctypes.c_int(1))
+            context.handleEventsTimeoutCompleted(0, ctypes.c_int(0))
+
+    def testUSBEventThread(self):
+        """
+        Event thread reports event handling errors to its callback, and
+        stops without waiting for its timeout.
+        Its handling time only accounts for transfer callbacks.
+        """
+        with USBContext() as context:
+            if not hasattr(usb1.libusb1, 'libusb_interrupt_event_handler'):
+                raise unittest.SkipTest(
+                    'libusb_interrupt_event_handler missing',
+                )
+            exception_list = []
+            callback_event = threading.Event()
+            def callback(_):
+                time.sleep(0.01)
+                callback_event.set()
+            transfer = USBTransferTests.getTransfer()
+            transfer.setCallback(callback)
+            handle_events = context.handleEventsTimeoutCompleted
+            def handleEventsTimeoutCompleted(tv, completed):
+                if not exception_list:
+                    raise usb1.USBErrorIO
+                if not callback_event.is_set():
+                    fakeCompletion(transfer, usb1.TRANSFER_COMPLETED, 0)
+                handle_events(tv, completed)
+            context.handleEventsTimeoutCompleted = handleEventsTimeoutCompleted
+            thread = usb1.USBEventThread(
+                context, exception_list.append, timeout=3600,
+            )
+            thread.start()
+            callback_event.wait()
+            # Thread is now waiting for events.
+            thread.join(0.2)
+            thread.stop()
+            self.assertFalse(thread.is_alive())
+            statistics = thread.getStatistics()
+            self.assertEqual(statistics['exceptions'], 1)
+            self.assertTrue(statistics['iterations'] >= 2)
+            self.assertTrue(0.01 <= statistics['handling_time'] < 0.2)
+            self.assertTrue(isinstance(exception_list[0], usb1.USBErrorIO))
+
+    def testCloseInterruptsEventHandling(self):
+        """
+        Closing a context makes threads handling its events return
+        immediately.
+        """
+        if not hasattr(usb1.libusb1, 'libusb_interrupt_event_handler'):
+            raise unittest.SkipTest('libusb_interrupt_event_handler missing')
+        context = USBContext().open()
+        started = threading.Event()
+        def handleEvents():
+            started.set()
+            context.handleEventsTimeout(3600)
+        thread = threading.Thread(target=handleEvents)
+        thread.daemon = True
+        thread.start()
+        started.wait()
+        # Let thread enter libusb.
+        thread.join(0.1)
+        context.close()
+        thread.join(10)
+        self.assertFalse(thread.is_alive())
+
+    def testHandleCloseWaitsCompletion(self):
+        """
+        Handle close notices completions handled by another thread.
+        """
+        transfer = self.getTransfer()
+        transfer.cancel = lambda: None
+        completed_list = []
+        class FakeContext(object):
+            @staticmethod
+            def handleEventsCompleted(completed):
+                # As if another thread handled the cancellation.
+                handle._USBDeviceHandle__inflight_remove(transfer)
+                completed_list.append(completed.value)
+        handle = usb1.USBDeviceHandle(
+            FakeContext(), pointer(libusb1.libusb_device_handle()), None,
+        )
+        handle._USBDeviceHandle__libusb_close = lambda handle: None
+        handle._USBDeviceHandle__inflight_add(transfer)
+        handle.close()
+        self.assertEqual(completed_list, [1])
+
     def testUSBTransferMayRaiseUSBError(self):
         """
         mayRaiseUSBError needs to be a class property to be reliably able